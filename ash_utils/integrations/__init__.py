@@ -1,5 +1,15 @@
+from ash_utils.integrations.background_sink import BackgroundRedactionSink
 from ash_utils.integrations.constants import KEYS_TO_FILTER
-from ash_utils.integrations.loguru import PhiPiiLogRedactor
+from ash_utils.integrations.json_sink import RedactingJsonSink
+from ash_utils.integrations.loguru import DEFAULT_SAFE_KEYS, PhiPiiLogRedactor, PhiPiiLogRedactorConfig
+from ash_utils.integrations.redaction_rules import (
+    AllowRule,
+    ContainerRule,
+    KeyRule,
+    RedactionRuleError,
+    RedactionRules,
+    ValueRule,
+)
 from ash_utils.integrations.sentry import before_send, initialize_sentry
 from ash_utils.integrations.slack_formatter import (
     SlackAttachmentFormatter,
@@ -9,10 +19,20 @@ from ash_utils.integrations.slack_formatter import (
 )
 
 __all__ = [
+    "DEFAULT_SAFE_KEYS",
     "KEYS_TO_FILTER",
+    "AllowRule",
+    "BackgroundRedactionSink",
+    "ContainerRule",
+    "KeyRule",
     "PhiPiiLogRedactor",
+    "PhiPiiLogRedactorConfig",
+    "RedactingJsonSink",
+    "RedactionRuleError",
+    "RedactionRules",
     "SlackAttachmentFormatter",
     "SlackAttachmentFormatterConfig",
+    "ValueRule",
     "before_send",
     "build_gcp_logs_explorer_url",
     "build_sentry_issue_url",
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import sys
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from loguru import Message, Record
+
+    from ash_utils.integrations.json_sink import RedactingJsonSink
+
+DEFAULT_MAX_PENDING = 10_000
+
+
+@dataclass(frozen=True, slots=True)
+class BackgroundSinkStats:
+    """Records handed to the worker thread, how many of them waited for a full queue, and sink errors."""
+
+    queued: int
+    waited: int
+    errors: int
+
+
+class BackgroundRedactionSink:
+    """Loguru sink that redacts and writes records on a worker thread instead of the logging thread.
+
+    The logging call only captures the record and queues it; the wrapped `RedactingJsonSink` redacts, encodes and
+    writes it on one worker thread, in logging order. Only that sink ever receives the record, so no unredacted
+    record reaches an output. Add it instead of the redacting patcher, without `enqueue=True` (which would pickle
+    every record on the logging thread first):
+
+        logger.add(BackgroundRedactionSink(RedactingJsonSink()), format="{message}")
+
+    When `max_pending` records are waiting, the logging call waits for room rather than dropping the record or
+    writing it out of order. `logger.remove()` and `await logger.complete()` wait for the queued records; so does
+    `drain()`. Loguru only awaits `complete()`, so a bare synchronous `logger.complete()` does not wait and leaves an
+    unawaited coroutine behind; synchronous code calls `drain()` instead.
+
+    Values nested in `extra` are captured by reference, so an object mutated right after logging may be written
+    in its new state; it is redacted either way.
+    """
+
+    def __init__(self, sink: RedactingJsonSink, *, max_pending: int = DEFAULT_MAX_PENDING) -> None:
+        if max_pending < 1:
+            msg = f"max_pending must be at least 1, got {max_pending}"
+            raise ValueError(msg)
+        self.sink = sink
+        self._queue: queue.Queue[Record | None] = queue.Queue(maxsize=max_pending)
+        # Writes after `stop()` take the same lock as the worker, so the wrapped sink never runs on two threads at once.
+        self._sink_lock = threading.Lock()
+        # Held from the `_stopped` check to the `put`, and by `stop()`, so no record is queued behind the sentinel.
+        self._state_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._queued = 0
+        self._waited = 0
+        self._errors = 0
+        self._stopped = False
+        self._worker = threading.Thread(target=self._run, name="ash-redaction-writer", daemon=True)
+        self._worker.start()
+
+    @property
+    def stats(self) -> BackgroundSinkStats:
+        with self._stats_lock:
+            return BackgroundSinkStats(queued=self._queued, waited=self._waited, errors=self._errors)
+
+    def write(self, message: Message) -> None:
+        record = message.record
+        with self._state_lock:
+            if not self._stopped:
+                self._enqueue(record=record)
+                return
+        self._emit(record=record)
+
+    def drain(self) -> None:
+        """Block until every queued record has been written."""
+        self._queue.join()
+
+    async def complete(self) -> None:
+        """Wait for the queued records without blocking the event loop; called by `await logger.complete()`."""
+        await asyncio.to_thread(self.drain)
+
+    def stop(self) -> None:
+        """Write the queued records and stop the worker; records logged afterwards are written inline."""
+        with self._state_lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._queue.put(None)
+            # Joined under the lock, so a concurrent `write()` goes inline only after the queued records are written.
+            self._worker.join()
+
+    def _enqueue(self, record: Record) -> None:
+        waited = False
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            waited = True
+            self._queue.put(record)
+        with self._stats_lock:
+            self._queued += 1
+            self._waited += waited
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            try:
+                if record is None:
+                    return
+                self._emit(record=record)
+            finally:
+                self._queue.task_done()
+
+    def _emit(self, record: Record) -> None:
+        try:
+            with self._sink_lock:
+                self.sink.emit(record=record)
+        except Exception as error:  # A failing sink must not stop the worker.
+            with self._stats_lock:
+                self._errors += 1
+            # Only the error type: its message or the record could hold the values being redacted.
+            sys.stderr.write(f"BackgroundRedactionSink: sink raised {type(error).__name__}\n")
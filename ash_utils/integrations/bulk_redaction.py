@@ -0,0 +1,271 @@
+"""Redact exported JSONL log files with `PhiPiiLogRedactor`, in parallel.
+
+Each input is memory-mapped and split into chunks on line boundaries; a process pool redacts the chunks and the
+results are written in input order. JSON lines are redacted as values, like a record's `extra`, and any other line
+as text. Progress is saved next to the output after every chunk, so running the same command again after an
+interruption resumes where it stopped:
+
+    ash-redact-logs exports/*.json --output-dir redacted/
+    python -m ash_utils.integrations.bulk_redaction run.json --output-dir redacted/ --redactor my_service.log:redactor
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import mmap
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from ash_utils.integrations.loguru import PhiPiiLogRedactor
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+DEFAULT_CHUNK_MIB = 8
+MIB = 1024 * 1024
+# Chunks submitted ahead of the one being written, per worker; bounds the redacted output held in memory.
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+PROGRESS_SUFFIX = ".progress"
+REDACTION_ERROR_LINE = json.dumps({"redaction_error": PhiPiiLogRedactor.REDACTION_ERROR}).encode()
+
+
+@dataclass(frozen=True, slots=True)
+class Chunk:
+    path: str
+    start: int
+    end: int
+
+
+@dataclass(frozen=True, slots=True)
+class ChunkResult:
+    data: bytes
+    lines: int
+    errors: int
+
+
+@dataclass(slots=True)
+class Progress:
+    """The next input byte to redact and the output bytes written before it, for one input in its current state."""
+
+    input_size: int
+    input_mtime_ns: int
+    input_offset: int = 0
+    output_offset: int = 0
+
+
+@dataclass(slots=True)
+class ThroughputReport:
+    """Running totals for one input, written to stderr after every chunk."""
+
+    name: str
+    total_bytes: int
+    resumed_bytes: int
+    started: float
+    done_bytes: int = 0
+    lines: int = 0
+    errors: int = 0
+
+    def add(self, chunk_bytes: int, result: ChunkResult) -> None:
+        self.done_bytes += chunk_bytes
+        self.lines += result.lines
+        self.errors += result.errors
+
+    def format(self) -> str:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        position = self.resumed_bytes + self.done_bytes
+        percent = 100 * position / self.total_bytes if self.total_bytes else 100.0
+        return (
+            f"{self.name}: {position / MIB:.1f}/{self.total_bytes / MIB:.1f} MiB ({percent:.0f}%), "
+            f"{self.done_bytes / MIB / elapsed:.1f} MiB/s, {self.lines / elapsed:.0f} lines/s, "
+            f"{self.errors} redaction errors"
+        )
+
+
+@cache
+def get_redactor(redactor_path: str | None) -> PhiPiiLogRedactor:
+    """Build the redactor once per process, from a `module:attribute` factory or with the default config."""
+    if redactor_path is None:
+        return PhiPiiLogRedactor()
+    module_name, _, attribute = redactor_path.partition(":")
+    factory = getattr(importlib.import_module(name=module_name), attribute)
+    redactor = factory()
+    if not isinstance(redactor, PhiPiiLogRedactor):
+        msg = f"{redactor_path} returned {type(redactor).__name__}, not a PhiPiiLogRedactor"
+        raise TypeError(msg)
+    return redactor
+
+
+def redact_line(line: bytes, redactor: PhiPiiLogRedactor) -> bytes:
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        # Not JSON (or not UTF-8): a plain-text export line, redacted like a log message.
+        return redactor.redact_text(value=line.decode(errors="replace")).encode()
+    redacted = redactor.redact_value(value=entry)
+    return json.dumps(redacted, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def redact_chunk(chunk: Chunk, redactor_path: str | None) -> ChunkResult:
+    """Redact the lines of one chunk in a worker process, which maps the input itself instead of receiving it."""
+    redactor = get_redactor(redactor_path=redactor_path)
+    with Path(chunk.path).open("rb") as source, mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        lines = data[chunk.start : chunk.end].split(b"\n")
+    redacted_lines = []
+    errors = 0
+    for line in lines:
+        if not line.strip():
+            redacted_lines.append(line)
+            continue
+        try:
+            redacted_lines.append(redact_line(line=line, redactor=redactor))
+        except Exception:
+            errors += 1
+            redacted_lines.append(REDACTION_ERROR_LINE)
+    # A chunk ending in a newline splits into a last, empty piece that is not a line.
+    return ChunkResult(data=b"\n".join(redacted_lines), lines=len(lines) - (not lines[-1]), errors=errors)
+
+
+def split_chunks(data: mmap.mmap, start: int, chunk_bytes: int) -> Iterator[tuple[int, int]]:
+    """Yield `(start, end)` byte ranges of about `chunk_bytes`, each ending just after a newline or at the end."""
+    size = len(data)
+    while start < size:
+        newline = data.find(b"\n", start + chunk_bytes - 1)
+        end = size if newline == -1 else newline + 1
+        yield start, end
+        start = end
+
+
+def get_progress_path(output_path: Path) -> Path:
+    return output_path.with_name(output_path.name + PROGRESS_SUFFIX)
+
+
+def load_progress(input_path: Path, output_path: Path) -> Progress:
+    """Return the saved progress, or a fresh one when the input changed or the output no longer holds it."""
+    stat = input_path.stat()
+    fresh = Progress(input_size=stat.st_size, input_mtime_ns=stat.st_mtime_ns)
+    progress_path = get_progress_path(output_path=output_path)
+    try:
+        saved = Progress(**json.loads(progress_path.read_text()))
+    except (OSError, ValueError, TypeError):
+        return fresh
+    if (saved.input_size, saved.input_mtime_ns) != (fresh.input_size, fresh.input_mtime_ns):
+        return fresh
+    if not output_path.exists() or output_path.stat().st_size < saved.output_offset:
+        return fresh
+    return saved
+
+
+def save_progress(progress: Progress, output_path: Path) -> None:
+    progress_path = get_progress_path(output_path=output_path)
+    temporary_path = progress_path.with_name(progress_path.name + ".tmp")
+    temporary_path.write_text(json.dumps(asdict(progress)))
+    temporary_path.replace(progress_path)
+
+
+def redact_file(
+    input_path: Path,
+    output_path: Path,
+    *,
+    executor: ProcessPoolExecutor,
+    workers: int,
+    chunk_bytes: int,
+    redactor_path: str | None,
+) -> ThroughputReport:
+    """Redact `input_path` into `output_path`, resuming from saved progress, and remove the progress when done."""
+    progress = load_progress(input_path=input_path, output_path=output_path)
+    report = ThroughputReport(
+        name=input_path.name,
+        total_bytes=progress.input_size,
+        resumed_bytes=progress.input_offset,
+        started=time.perf_counter(),
+    )
+    max_in_flight = workers * CHUNKS_IN_FLIGHT_PER_WORKER
+    pending: deque[tuple[Chunk, Future[ChunkResult]]] = deque()
+    with output_path.open("r+b" if progress.input_offset else "wb") as output, input_path.open("rb") as source:
+        output.truncate(progress.output_offset)
+        output.seek(progress.output_offset)
+        if progress.input_size > progress.input_offset:
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for start, end in split_chunks(data=data, start=progress.input_offset, chunk_bytes=chunk_bytes):
+                    chunk = Chunk(path=str(input_path), start=start, end=end)
+                    pending.append((chunk, executor.submit(redact_chunk, chunk, redactor_path)))
+                    if len(pending) >= max_in_flight:
+                        _write_chunk(*pending.popleft(), output=output, progress=progress, report=report)
+        while pending:
+            _write_chunk(*pending.popleft(), output=output, progress=progress, report=report)
+    get_progress_path(output_path=output_path).unlink(missing_ok=True)
+    return report
+
+
+def _write_chunk(
+    chunk: Chunk,
+    future: Future[ChunkResult],
+    *,
+    output: BinaryIO,
+    progress: Progress,
+    report: ThroughputReport,
+) -> None:
+    result = future.result()
+    output.write(result.data)
+    output.flush()
+    # Progress never points past output that is not on disk yet, so a resumed run cannot leave a gap.
+    os.fsync(output.fileno())
+    progress.input_offset = chunk.end
+    progress.output_offset += len(result.data)
+    save_progress(progress=progress, output_path=Path(output.name))
+    report.add(chunk_bytes=chunk.end - chunk.start, result=result)
+    sys.stderr.write(report.format() + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="ash-redact-logs", description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument("inputs", nargs="+", type=Path, help="JSONL files to redact")
+    parser.add_argument("--output-dir", type=Path, required=True, help="directory for the redacted files")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-mib", type=int, default=DEFAULT_CHUNK_MIB, help="approximate chunk size")
+    parser.add_argument(
+        "--redactor",
+        help="module:attribute of a callable returning the PhiPiiLogRedactor to use, e.g. a service's configured one",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.chunk_mib < 1:
+        parser.error("--workers and --chunk-mib must be at least 1")
+    # Fails here, once, rather than in every worker.
+    get_redactor(redactor_path=args.redactor)
+    # Outputs are named after the inputs, so two inputs with one name would overwrite each other's output and progress.
+    names = [path.name for path in args.inputs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        parser.error(f"inputs share file names, so their outputs would collide: {', '.join(duplicates)}")
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    outputs = [args.output_dir / name for name in names]
+    if any(output.resolve() == path.resolve() for path, output in zip(args.inputs, outputs, strict=True)):
+        parser.error("--output-dir must not contain the inputs")
+
+    errors = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for input_path, output_path in zip(args.inputs, outputs, strict=True):
+            report = redact_file(
+                input_path=input_path,
+                output_path=output_path,
+                executor=executor,
+                workers=args.workers,
+                chunk_bytes=args.chunk_mib * MIB,
+                redactor_path=args.redactor,
+            )
+            sys.stderr.write(f"done {report.format()}\n")
+            errors += report.errors
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import sys
+import traceback
+from typing import TYPE_CHECKING, Any, TextIO, cast
+
+from loguru._recattrs import RecordException
+
+from ash_utils.integrations.loguru import REDACTION_MARKER_KEY, PhiPiiLogRedactor
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from loguru import Message, Record
+
+# Loguru level names mapped to Cloud Logging severities; custom levels fall back by level number.
+GCP_SEVERITIES = {
+    "TRACE": "DEBUG",
+    "DEBUG": "DEBUG",
+    "INFO": "INFO",
+    "SUCCESS": "NOTICE",
+    "WARNING": "WARNING",
+    "ERROR": "ERROR",
+    "CRITICAL": "CRITICAL",
+}
+GCP_SEVERITY_THRESHOLDS = ((50, "CRITICAL"), (40, "ERROR"), (30, "WARNING"), (20, "INFO"), (0, "DEBUG"))
+SOURCE_LOCATION_FIELD = "logging.googleapis.com/sourceLocation"
+TRACE_FIELD = "logging.googleapis.com/trace"
+SPAN_ID_FIELD = "logging.googleapis.com/spanId"
+UNSERIALIZABLE = "[UNSERIALIZABLE]"
+
+
+class RedactingJsonSink:
+    """Loguru sink that redacts each record and writes it as one Cloud Logging structured JSON line.
+
+    Use it instead of `serialize=True` plus a `PhiPiiLogRedactor` patcher: the record is redacted once, without
+    touching the record other sinks receive, and only the structured fields are encoded, by one reused encoder:
+
+        logger.add(RedactingJsonSink(gcp_project_id="my-project"), format="{message}")
+
+    `extra` values become top-level `jsonPayload` fields next to `severity`, `message`, `time`, `logger` and the
+    `logging.googleapis.com/sourceLocation` field; an exception adds its redacted traceback as `stack_trace`, which
+    Error Reporting picks up. With `gcp_project_id` set, `trace_id` and `span_id` extras are also written as the
+    trace fields that correlate the line with its request in Cloud Trace.
+    """
+
+    def __init__(
+        self,
+        redactor: PhiPiiLogRedactor | None = None,
+        *,
+        stream: TextIO | None = None,
+        gcp_project_id: str | None = None,
+    ) -> None:
+        self.redactor = redactor or PhiPiiLogRedactor()
+        self.stream = stream or sys.stderr
+        self.gcp_project_id = gcp_project_id
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+
+    def __call__(self, message: Message) -> None:
+        self.emit(record=message.record)
+
+    def emit(self, record: Record) -> None:
+        """Redact `record` and write it as one JSON line; the record itself is left unchanged."""
+        # One write per record, so lines from concurrent writers to the same stream never interleave mid-line.
+        self.stream.write(self.format_record(record=record) + "\n")
+        self.stream.flush()
+
+    def format_record(self, record: Record) -> str:
+        redacted: dict[str, Any] = {
+            "message": record["message"],
+            "extra": record["extra"],
+            "exception": record["exception"],
+            # Carried over so the redactor skips a record it already redacted upstream.
+            REDACTION_MARKER_KEY: cast("Mapping[str, object]", record).get(REDACTION_MARKER_KEY),
+        }
+        self.redactor.redact_record(record=redacted)
+        payload = self._build_payload(record=record, redacted=redacted)
+        try:
+            return self._encoder.encode(payload)
+        except (TypeError, ValueError):
+            # Keys JSON cannot encode (such as tuples) or values whose `str()` fails; the fields above still log.
+            payload = self._build_payload(record=record, redacted={**redacted, "extra": {"extra": UNSERIALIZABLE}})
+            return self._encoder.encode(payload)
+
+    def _build_payload(self, record: Record, redacted: dict[str, Any]) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "severity": self._get_severity(name=record["level"].name, number=record["level"].no),
+            "message": redacted["message"],
+            "time": record["time"].isoformat(),
+            "logger": record["name"],
+            SOURCE_LOCATION_FIELD: {
+                "file": record["file"].path,
+                "line": str(record["line"]),
+                "function": record["function"],
+            },
+        }
+        stack_trace = self._format_stack_trace(exception=redacted["exception"])
+        if stack_trace is not None:
+            payload["stack_trace"] = stack_trace
+        extra = redacted["extra"]
+        if isinstance(extra, dict):
+            self._add_trace_fields(payload=payload, extra=extra)
+            for key, value in extra.items():
+                payload.setdefault(str(key), value)
+        return payload
+
+    @staticmethod
+    def _get_severity(name: str, number: int) -> str:
+        severity = GCP_SEVERITIES.get(name)
+        if severity is not None:
+            return severity
+        return next(severity for threshold, severity in GCP_SEVERITY_THRESHOLDS if number >= threshold)
+
+    def _format_stack_trace(self, exception: object) -> str | None:
+        if not isinstance(exception, RecordException) or exception.value is None:
+            return None
+        text = "".join(traceback.format_exception(exception.type, exception.value, exception.traceback))
+        # Source lines are not part of the redacted exception chain, so the formatted text is redacted too.
+        return self.redactor.redact_text(value=text)
+
+    def _add_trace_fields(self, payload: dict[str, Any], extra: dict[str, Any]) -> None:
+        trace_id = extra.get("trace_id")
+        if self.gcp_project_id is None or not trace_id:
+            return
+        payload[TRACE_FIELD] = f"projects/{self.gcp_project_id}/traces/{trace_id}"
+        if span_id := extra.get("span_id"):
+            payload[SPAN_ID_FIELD] = str(span_id)
@@ -1,8 +1,402 @@
+import codecs
+import copy
 import re
-from collections.abc import Mapping, MutableMapping
-from typing import Any, ClassVar
-
+import secrets
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
+from contextvars import ContextVar
+from dataclasses import dataclass, field, is_dataclass, replace
+from dataclasses import fields as dataclass_fields
+from enum import Enum
+from itertools import islice
+from typing import Any, ClassVar, cast, get_args
+
+from loguru._logger import context as logger_context
 from loguru._recattrs import RecordException
+from pydantic import BaseModel, PlainSerializer, WrapSerializer
+
+from ash_utils.integrations.redaction_cache import BoundedClockCache, CacheStats, ShardedCache
+from ash_utils.integrations.redaction_instrumentation import PerThreadCells, RedactionInstrumentation, RedactionStats
+from ash_utils.integrations.redaction_rules import RedactionRules
+
+DEFAULT_KEY_CACHE_SIZE = 1024
+DEFAULT_OBJECT_PLAN_CACHE_SIZE = 256
+DEFAULT_STRING_MEMO_MAX_CHARS = 512
+DEFAULT_EXCEPTION_CACHE_SIZE = 256
+DEFAULT_EXCEPTION_CACHE_MAX_CHARS = 4096
+DEFAULT_STREAM_SEGMENT_CHARS = 256 * 1024
+DEFAULT_STREAM_OVERLAP_CHARS = 4096
+# Cut points `redact_stream` tries per segment, spread over the overlap before the segment end.
+STREAM_CUT_ATTEMPTS = 8
+# Text `redact_stream` holds, in segments, while looking for a safe cut before it cuts anyway.
+STREAM_MAX_HELD_SEGMENTS = 4
+# Omitted items read for the element types of a collection summary, so huge collections stay cheap to summarize.
+SUMMARY_TYPE_SAMPLE_SIZE = 1024
+
+# String rule families in the order `_apply_string_rules` runs them; later passes read earlier output.
+STRING_RULES = ("email", "url_userinfo", "bearer", "secret", "result_object", "keyed_value")
+# The families that run before result calls are redacted; `redact_stream` replays them to find values left open.
+PRE_RESULT_STRING_RULES = frozenset(STRING_RULES[: STRING_RULES.index("result_object")])
+# Context values are only memoized when immutable, so a reused redaction can never go stale.
+MEMOIZABLE_CONTEXT_TYPES = (str, bytes, int, float, type(None))
+# Values no key-independent rule can change; plain keys pass them through untouched.
+PLAIN_SCALAR_TYPES = frozenset({int, float, bool, type(None)})
+PLAIN_CONTAINER_TYPES = frozenset({dict, list, tuple})
+# Set on the record itself (never in `extra`, which sinks format and serialize) once a redactor has redacted it with
+# `provenance_marker` set or through `sink_filter`. The value is drawn per redactor, so only the redactor that wrote it
+# skips the record again, and a value bound by hand cannot pass for it.
+REDACTION_MARKER_KEY = "_redacted_by"
+# Set on the record by `PhiPiiLogRedactor.withhold_record` until an accepting `sink_filter` puts the fields back.
+WITHHELD_FIELDS_KEY = "_withheld"
+# Values a safe key passes through untouched; containers under a safe key are still walked.
+SAFE_SCALAR_TYPES = PLAIN_SCALAR_TYPES | {str}
+# Identifiers and request metadata our services log on every request; opt in with `safe_keys=DEFAULT_SAFE_KEYS`.
+DEFAULT_SAFE_KEYS = frozenset({"request_id", "session_id", "kit_id", "order_id", "path", "method", "status_code"})
+# Returned by `PhiPiiLogRedactor._redact_node` when it pushed a container frame instead of producing a value.
+PENDING = object()
+# Key rule categories, in bit order of the mask `PhiPiiLogRedactor._match_key_rules` returns.
+KEY_RULES = (
+    "sensitive",
+    "email",
+    "phone",
+    "url",
+    "address",
+    "address_container",
+    "address_child",
+    "result_container",
+    "result_payload",
+    "loggable_result_payload",
+)
+KEY_RULE_BITS = {rule: 1 << bit for bit, rule in enumerate(KEY_RULES)}
+# Set for keys a configured allow rule matches; `_match_key_rules` then clears every other bit.
+ALLOWED_KEY_BIT = 1 << len(KEY_RULES)
+# Pattern flags that can be scoped to a group, so each embedded key pattern keeps its own.
+SCOPED_PATTERN_FLAGS = ((re.ASCII, "a"), (re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+SINGLE_STRING_RULES = {rule: frozenset({rule}) for rule in STRING_RULES}
+# Rule families left after the literal pre-screen, indexed by a bitmask with one bit per STRING_RULES entry.
+PREFILTERED_STRING_RULES = tuple(
+    frozenset(rule for bit, rule in enumerate(STRING_RULES) if mask >> bit & 1)
+    for mask in range(1 << len(STRING_RULES))
+)
+
+
+@dataclass(slots=True)
+class PhiPiiLogRedactorConfig:
+    key_cache_size: int = DEFAULT_KEY_CACHE_SIZE
+    object_plan_cache_size: int = DEFAULT_OBJECT_PLAN_CACHE_SIZE
+    # Redacted output of repeated strings, keyed by content; `0` disables it. Longer strings are never memoized.
+    string_memo_size: int = 0
+    string_memo_max_chars: int = DEFAULT_STRING_MEMO_MAX_CHARS
+    # Redacted exception messages, keyed by exception type and message; `0` disables it. Longer messages are never
+    # cached.
+    exception_cache_size: int = DEFAULT_EXCEPTION_CACHE_SIZE
+    exception_cache_max_chars: int = DEFAULT_EXCEPTION_CACHE_MAX_CHARS
+    # Per-record work budgets; `None` leaves that dimension unbounded.
+    max_string_chars: int | None = None
+    max_nodes: int | None = None
+    max_collection_items: int | None = None
+    # Lists, tuples and sets longer than this keep their first items, redacted, followed by a summary of the rest.
+    collection_summary_items: int | None = None
+    # Per-rule counters and timings read through `PhiPiiLogRedactor.redaction_stats`; off by default.
+    instrumentation: bool = False
+    # Service-specific key, value, container and allow rules, compiled into the matchers at construction.
+    rules: RedactionRules = field(default_factory=RedactionRules)
+    # Raw keys whose scalar values are trusted and returned without classification or string scanning.
+    safe_keys: frozenset[str] = frozenset()
+    # Mark redacted records so this redactor skips them if it sees them again (as a patcher and in a sink, say).
+    provenance_marker: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class StringRuleStats:
+    """How many strings each string rule family was skipped for, out of all strings screened."""
+
+    screened: int
+    skipped: dict[str, int]
+
+    def skip_ratio(self, rule: str) -> float:
+        return self.skipped.get(rule, 0) / self.screened if self.screened else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class SafeKeyStats:
+    """How many keyed values were walked and how many a safe key returned unscanned, with their string length."""
+
+    values: int
+    hits: int
+    chars_skipped: int
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.values if self.values else 0.0
+
+
+@dataclass(slots=True)
+class ContextRedactionMemo:
+    """Redacted values of one `logger.contextualize()` scope, keyed by extra key and result-payload flag."""
+
+    context: dict[str, Any]
+    values: dict[tuple[str, bool], object] = field(default_factory=dict)
+
+
+@dataclass(slots=True, repr=False)
+class WithheldRecordFields:
+    """The fields `withhold_record` took off a record; its `repr` hides them, as loguru prints failing records."""
+
+    message: object
+    extra: object
+    exception: object
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(...)"
+
+
+@dataclass(slots=True)
+class RedactionBudget:
+    """Work left for redacting one record; `exceeded` collects the config fields of exhausted budgets."""
+
+    string_chars: int | None
+    nodes: int | None
+    collection_items: int | None
+    exceeded: set[str] = field(default_factory=set)
+
+    def take_string(self, value: str) -> bool:
+        if self.string_chars is None:
+            return True
+        if len(value) > self.string_chars:
+            self.exceeded.add("max_string_chars")
+            return False
+        self.string_chars -= len(value)
+        return True
+
+    def take_node(self) -> bool:
+        if self.nodes is None:
+            return True
+        if self.nodes <= 0:
+            self.exceeded.add("max_nodes")
+            return False
+        self.nodes -= 1
+        return True
+
+    def take_value(self, value: object) -> bool:
+        return self.take_node() and (not isinstance(value, str) or self.take_string(value=value))
+
+    def item_limit(self, count: int) -> int:
+        """Return how many of a collection's `count` items may be visited; each item costs at least one node."""
+        limit = count
+        if self.collection_items is not None and limit > self.collection_items:
+            limit = self.collection_items
+            self.exceeded.add("max_collection_items")
+        if self.nodes is not None and limit > self.nodes:
+            limit = max(self.nodes, 0)
+            self.exceeded.add("max_nodes")
+        return limit
+
+
+@dataclass(frozen=True, slots=True)
+class KeyClassification:
+    """Precomputed key rule outcomes for one raw key, shared by every record that logs it."""
+
+    normalized: str
+    is_sensitive: bool
+    is_email: bool
+    is_phone: bool
+    is_url: bool
+    is_address: bool
+    is_address_container: bool
+    is_address_child: bool
+    is_result_container: bool
+    is_result_payload: bool
+    is_loggable_result_payload: bool
+    is_string_sensitive: bool
+    # No key rule applies to the value itself; only result-payload handling and string rules can change it.
+    is_plain: bool
+    # A configured safe key: scalar values are returned as they are, containers are redacted as usual. Safe keys are
+    # never plain, so their values leave the plain fast path for `_redact_frame_child`.
+    is_safe: bool = False
+
+    def redacts_value(self, *, in_result_payload: bool) -> bool:
+        return self.is_sensitive or self.is_address or (in_result_payload and self.is_result_payload)
+
+    @property
+    def redacts_any_value(self) -> bool:
+        # Email, phone and URL keys mask some values instead of redacting them, and take precedence.
+        return (self.is_sensitive or self.is_address) and not (self.is_email or self.is_phone or self.is_url)
+
+
+@dataclass(frozen=True, slots=True)
+class ConfiguredKeyRule:
+    """A configured key, container or allow rule, compiled against normalized keys; `bit` is the rule bit it sets."""
+
+    pattern: re.Pattern[str]
+    search: bool
+    bit: int
+
+
+@dataclass(frozen=True, slots=True)
+class ObjectRedactionPlan:
+    """How one pydantic model, dataclass or namedtuple class is redacted as a mapping of its fields.
+
+    Built once per class: `always_redacted` marks fields whose key redacts any value, so they are never read, and
+    `scalar_types` adds the enum field types no string rule changes to the values plain keys pass through.
+    `uses_model_dump` marks models whose `model_dump()` a plan cannot reproduce, such as custom serializers.
+    """
+
+    fields: tuple[str, ...]
+    classifications: tuple[KeyClassification, ...]
+    always_redacted: tuple[bool, ...]
+    scalar_types: frozenset[type]
+    is_result_payload: bool
+    uses_model_dump: bool = False
+
+
+@dataclass(slots=True)
+class RedactionFrame:
+    """A container on the explicit stack of `PhiPiiLogRedactor._walk`.
+
+    Mapping frames carry per-child `keys` and `classifications`; a sequence frame repeats the classification of the
+    key it sits under for every item.
+    `redacted` stays `None` until a child changes, so untouched containers are returned as-is.
+    """
+
+    source: object
+    values: list[object] | tuple[object, ...]
+    classifications: list[KeyClassification]
+    child_depth: int
+    in_result_payload: bool
+    keys: list[object] | None = None
+    truncated: int = 0
+    # Type names of the truncated items, set when the redactor summarizes collections.
+    truncated_types: tuple[str, ...] = ()
+    scalar_types: frozenset[type] = PLAIN_SCALAR_TYPES
+    in_object: bool = False
+    address_payload: bool = False
+    context_memo: ContextRedactionMemo | None = None
+    index: int = 0
+    redacted: list[object] | None = None
+
+    @property
+    def has_special_children(self) -> bool:
+        return self.address_payload or self.context_memo is not None
+
+    def accept(self, redacted: object) -> None:
+        """Record the redacted value of the child at `index` and move past it."""
+        index = self.index
+        if self.redacted is not None:
+            self.redacted.append(redacted)
+        elif redacted is not self.values[index]:
+            self.redacted = [*self.values[:index], redacted]
+        self.index = index + 1
+
+
+@dataclass(slots=True)
+class OpenStreamValue:
+    """A value a `redact_stream` segment ends inside, whose redaction goes on through the text that follows.
+
+    Keyed values start unresolved, and their first character picks the kind, as in `_find_value_end`. Result calls
+    count parentheses only, as in `_find_balanced_call_end`. A `run` is text without a `BREAK_PATTERN` character,
+    too long to hold, and ends just before the next one.
+    """
+
+    parens_only: bool = False
+    run: bool = False
+    # URL keys redact quoted and plain values as text in their own right, so only their bracketed values stay open.
+    url: bool = False
+    started: bool = False
+    scalar: bool = False
+    closers: list[str] = field(default_factory=list)
+    quote: str = ""
+    escaped: bool = False
+
+    PAIRS: ClassVar[dict[str, str]] = {"{": "}", "[": "]", "(": ")"}
+    # Characters no secret, bearer token or email can contain, so a stream cut just after one never splits them.
+    BREAK_PATTERN: ClassVar[re.Pattern[str]] = re.compile(pattern=r"[\s,;}\]]")
+    BRACKET_PATTERN: ClassVar[re.Pattern[str]] = re.compile(pattern=r"""['"{}\[\]()]""")
+    PAREN_PATTERN: ClassVar[re.Pattern[str]] = re.compile(pattern=r"""['"()]""")
+    SCALAR_END_PATTERN: ClassVar[re.Pattern[str]] = re.compile(pattern=r"[,}\]]")
+    QUOTE_END_PATTERNS: ClassVar[dict[str, re.Pattern[str]]] = {
+        quote: re.compile(pattern=rf"[{quote}\\]") for quote in "'\""
+    }
+
+    def find_end(self, text: str, start: int) -> int | None:
+        """Return the index just past this value in `text`, from `start`, or `None` if `text` ends first.
+
+        On `None` the state has moved to the end of `text`, so the search goes on in the text after it.
+        """
+        cursor = start
+        if self.run:
+            match = self.BREAK_PATTERN.search(text, cursor)
+            return None if match is None else match.start()
+        if not self.started:
+            while cursor < len(text) and text[cursor].isspace():
+                cursor += 1
+            if cursor == len(text):
+                return None
+            if not self._start(first=text[cursor]):
+                return cursor
+            if not self.scalar:
+                # Past the opening bracket or quote.
+                cursor += 1
+        if self.scalar:
+            match = self.SCALAR_END_PATTERN.search(text, cursor)
+            return None if match is None else match.start()
+        return self._find_closing_end(text=text, start=cursor)
+
+    def _start(self, first: str) -> bool:
+        """Pick the kind of value `first` starts; `False` if that kind is not left open (a URL key's plain value)."""
+        self.started = True
+        if first in "{[" or (first == "(" and not self.url):
+            self.closers.append(self.PAIRS[first])
+        elif self.url:
+            return False
+        elif first in "'\"":
+            self.quote = first
+        else:
+            self.scalar = True
+        return True
+
+    def _find_closing_end(self, text: str, start: int) -> int | None:
+        cursor = start
+        pattern = self.PAREN_PATTERN if self.parens_only else self.BRACKET_PATTERN
+        while True:
+            if self.quote:
+                quote_end = self._find_quote_end(text=text, start=cursor)
+                if quote_end is None or not self.closers:
+                    return quote_end
+                cursor = quote_end
+            match = pattern.search(text, cursor)
+            if match is None:
+                return None
+            char = match.group()
+            cursor = match.end()
+            if char in "'\"":
+                self.quote = char
+            elif char in self.PAIRS:
+                self.closers.append(self.PAIRS[char])
+            elif char == self.closers[-1]:
+                self.closers.pop()
+                if not self.closers:
+                    return cursor
+
+    def _find_quote_end(self, text: str, start: int) -> int | None:
+        # A backslash escapes the next character, which may be at the start of the next text.
+        cursor = start
+        if self.escaped:
+            if cursor == len(text):
+                return None
+            cursor += 1
+            self.escaped = False
+        pattern = self.QUOTE_END_PATTERNS[self.quote]
+        while match := pattern.search(text, cursor):
+            if match.group() == self.quote:
+                self.quote = ""
+                return match.end()
+            if match.end() == len(text):
+                self.escaped = True
+                return None
+            cursor = match.end() + 1
+        return None
 
 
 class PhiPiiLogRedactor:
@@ -10,14 +404,30 @@ class PhiPiiLogRedactor:
 
     REDACTED = "[REDACTED]"
     REDACTION_ERROR = "[REDACTION_ERROR]"
+    REDACTION_BUDGET_KEY = "redaction_budget_exceeded"
+    TRUNCATED = "[TRUNCATED]"
+    TRUNCATED_ITEMS = "[TRUNCATED: {count} more items]"
+    SUMMARIZED_ITEMS = "[TRUNCATED: {count} more items of {types}]"
     REDACTION_DEPTH = 8
     EMAIL_LOCAL_PREFIX_VISIBLE_LEN = 3
     ACRONYM_PREFIX_MIN_LENGTH = 2
+    RESULT_OBJECT_AFFIX_MAX_LEN = 2048
 
     email_pattern: ClassVar[re.Pattern[str]] = re.compile(
         pattern=r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b",
         flags=re.IGNORECASE,
     )
+    # `email_pattern` split at the `@` so every character is examined a bounded number of times: each local-part
+    # run is consumed once (it cannot contain `@`), and the domain only depends on where the `@` is.
+    email_local_run_pattern: ClassVar[re.Pattern[str]] = re.compile(
+        pattern=r"(?<![A-Z0-9._%+-])[A-Z0-9._%+-]++@",
+        flags=re.IGNORECASE,
+    )
+    email_domain_pattern: ClassVar[re.Pattern[str]] = re.compile(
+        pattern=r"[A-Z0-9.-]+\.[A-Z]{2,}\b",
+        flags=re.IGNORECASE,
+    )
+    word_boundary_pattern: ClassVar[re.Pattern[str]] = re.compile(pattern=r"\b")
     url_userinfo_pattern: ClassVar[re.Pattern[str]] = re.compile(
         pattern=r"(https?://)([^/?#]+)@([^/?#]+)",
         flags=re.IGNORECASE,
@@ -25,14 +435,14 @@ class PhiPiiLogRedactor:
     secret_value_pattern: ClassVar[re.Pattern[str]] = re.compile(
         pattern=(
             r"\b(?P<secret_key>auth|authorization|api[_-]?key|token|secret|password|passwd|credential|cookie|"
-            r"signature|signedheaders)\b(?P<secret_separator>\s*[:=]\s*)"
+            r"signature|signedheaders)\b(?P<secret_separator>\s*+[:=]\s*+)"
             r"(?!(?:bearer\s+)?" + re.escape(REDACTED) + r"(?:$|[\s,;}\]]))"
             r"(?P<secret_bearer>bearer\s+)?[^\s,;}\]]+"
         ),
         flags=re.IGNORECASE,
     )
     bearer_token_pattern: ClassVar[re.Pattern[str]] = re.compile(
-        pattern=r"\bbearer\s+[a-z0-9._~+/-]+=*",
+        pattern=r"\bbearer\s++[a-z0-9._~+/-]++=*+",
         flags=re.IGNORECASE,
     )
     test_result_pattern: ClassVar[re.Pattern[str]] = re.compile(
@@ -49,6 +459,13 @@ class PhiPiiLogRedactor:
         pattern=r"\b[a-z_]\w{0,2048}Results?\w{0,2048}\s*\(",
         flags=re.IGNORECASE,
     )
+    # Linear form of `result_object_head_pattern`: match each call head once, then check the bounded
+    # `Result` affixes on its name instead of backtracking through both `\w{0,2048}` runs.
+    result_object_call_pattern: ClassVar[re.Pattern[str]] = re.compile(
+        pattern=r"\b(?P<name>[a-z_]\w*+)\s*+\(",
+        flags=re.IGNORECASE,
+    )
+    result_object_name_pattern: ClassVar[re.Pattern[str]] = re.compile(pattern=r"results?", flags=re.IGNORECASE)
     loggable_result_payload_key_pattern: ClassVar[re.Pattern[str]] = re.compile(
         pattern=r"^(?:units|(?:collection|received|reported)_dates?|date_reported)$",
         flags=re.IGNORECASE,
@@ -56,12 +473,17 @@ class PhiPiiLogRedactor:
     keyed_value_pattern: ClassVar[re.Pattern[str]] = re.compile(
         pattern=(
             r"(?:"
-            r"(?P<quote>['\"])(?P<quoted_key>[A-Za-z_][A-Za-z0-9_]*)(?P=quote)\s*:"
-            r"|(?P<plain_key>[A-Za-z_][A-Za-z0-9_]*)\s*="
-            r")\s*"
+            r"(?P<quote>['\"])(?P<quoted_key>[A-Za-z_][A-Za-z0-9_]*+)(?P=quote)\s*+:"
+            r"|(?<![A-Za-z0-9_])[0-9]*+(?P<plain_key>[A-Za-z_][A-Za-z0-9_]*+)\s*+="
+            r")\s*+"
         ),
         flags=re.IGNORECASE,
     )
+    # A quoted value runs to the first quote preceded by an even number of backslashes.
+    quoted_value_patterns: ClassVar[dict[str, re.Pattern[str]]] = {
+        quote: re.compile(pattern=rf"{quote}(?:[^{quote}\\]++|\\.?)*+{quote}?", flags=re.DOTALL) for quote in "'\""
+    }
+    scalar_value_pattern: ClassVar[re.Pattern[str]] = re.compile(pattern=r"[^,}\]]*+")
     # Underscore-delimited segments only (normalized keys are snake_case). Substrings like `pass`
     # inside `bypass` must not match; exceptions such as session_id use negative lookahead on segments.
     sensitive_key_pattern: ClassVar[re.Pattern[str]] = re.compile(
@@ -107,16 +529,160 @@ class PhiPiiLogRedactor:
         pattern=r"^(?:address_?[12]|line_?[12]|street(?:_address)?)$",
         flags=re.IGNORECASE,
     )
+    # The shortest text each string rule family needs before its pattern can match. A string without any
+    # trigger is left untouched, so one linear scan over the combined triggers replaces six rewrite passes.
+    string_rule_triggers: ClassVar[dict[str, str]] = {
+        "email": r"[A-Z0-9._%+-]@",
+        "url_userinfo": r"https?://",
+        "bearer": r"\bbearer\s",
+        "secret": (
+            r"\b(?:auth|authorization|api[_-]?key|token|secret|password|passwd|credential|cookie|"
+            r"signature|signedheaders)\b\s*+[:=]"
+        ),
+        "result_object": r"\w\s*+\(",
+        "keyed_value": r"\w['\"]\s*+:|\w\s*+=",
+    }
+    bearer_literal_pattern: ClassVar[re.Pattern[str]] = re.compile(pattern="bearer", flags=re.IGNORECASE)
+    string_rule_patterns: ClassVar[dict[str, str]] = {
+        "email": "email_pattern",
+        "url_userinfo": "url_userinfo_pattern",
+        "bearer": "bearer_token_pattern",
+        "secret": "secret_value_pattern",
+        "result_object": "result_object_head_pattern",
+        "keyed_value": "keyed_value_pattern",
+    }
+
+    # The per-rule check behind each key rule; a subclass overriding one is classified rule by rule.
+    key_rule_methods: ClassVar[dict[str, str]] = {
+        "sensitive": "_is_sensitive_key",
+        "email": "_is_email_key",
+        "phone": "_is_phone_key",
+        "url": "_is_url_key",
+        "address": "_is_address_key",
+        "address_container": "_is_address_container_key",
+        "address_child": "_is_address_child_key",
+        "result_container": "_is_test_result_container_key",
+        "result_payload": "_is_test_result_payload_key",
+        "loggable_result_payload": "_is_loggable_result_payload_key",
+    }
+    group_name_pattern: ClassVar[re.Pattern[str]] = re.compile(pattern=r"\(\?P(?:<(\w+)>|=(\w+)\))")
+    numbered_backreference_pattern: ClassVar[re.Pattern[str]] = re.compile(pattern=r"\\[1-9]")
+    # `_normalize_key` for ASCII keys: an underscore goes before an uppercase letter that follows a lowercase letter
+    # or digit, or that starts a word after two or more capitals (`HTTPSUrl` is `https_url`, but `OAuthScope` is
+    # `oauth_scope`); then every run of other characters becomes one underscore.
+    mixed_case_boundary_pattern: ClassVar[re.Pattern[str]] = re.compile(
+        pattern=r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z]{2})(?=[A-Z][a-z])"
+    )
+    key_separator_run_pattern: ClassVar[re.Pattern[str]] = re.compile(pattern=r"[^0-9A-Za-z]+")
+
+    def __init__(self, config: PhiPiiLogRedactorConfig | None = None) -> None:
+        self.config = config or PhiPiiLogRedactorConfig()
+        self.redaction_marker = f"{type(self).__name__}:{secrets.token_hex(nbytes=8)}"
+        self._configured_key_rules = self._compile_configured_key_rules(rules=self.config.rules)
+        self._key_rule_matcher = self._compile_key_rule_matcher()
+        # (offset in `Match.groups()`, rule bit) of each rule group in the combined matcher.
+        group_index = {} if self._key_rule_matcher is None else self._key_rule_matcher.groupindex
+        group_bits = {
+            **KEY_RULE_BITS,
+            **{f"configured_{index}": rule.bit for index, rule in enumerate(self._configured_key_rules)},
+        }
+        self._key_rule_groups = tuple((group_index[name] - 1, bit) for name, bit in group_bits.items() if group_index)
+        self._value_rule_pattern, self._value_rules = self._compile_value_rules(rules=self.config.rules)
+        # Caches and counters are shared by every thread redacting with this instance: caches are sharded and
+        # counters kept per thread, so a thread pool (or a free-threaded build) does not serialize on one lock.
+        self._key_cache: ShardedCache[str, KeyClassification] = ShardedCache(maxsize=self.config.key_cache_size)
+        # Classified once here, so safe keys skip normalization and the key cache on every record.
+        self._safe_key_classifications = {
+            key: replace(
+                self._build_key_classification(normalized_key=self._normalize_key(key=key)),
+                is_plain=False,
+                is_safe=True,
+            )
+            for key in self.config.safe_keys
+        }
+        # [values, hits, chars skipped] per thread.
+        self._safe_key_counters = PerThreadCells(factory=lambda: [0, 0, 0])
+        # Triggers describe the default patterns only; families whose pattern a subclass overrides always run.
+        self._untriggered_string_rules = frozenset(
+            rule
+            for rule, attribute in self.string_rule_patterns.items()
+            if getattr(self, attribute) is not getattr(PhiPiiLogRedactor, attribute)
+        )
+        self._string_rule_trigger_patterns: dict[frozenset[str], re.Pattern[str]] = {}
+        # [strings screened, then skips of each of `STRING_RULES`] per thread.
+        self._string_rule_counters = PerThreadCells(factory=lambda: [0] * (len(STRING_RULES) + 1))
+        self._context_memo: ContextVar[ContextRedactionMemo | None] = ContextVar(
+            f"phi_pii_context_memo_{id(self)}",
+            default=None,
+        )
+        self._object_plans: ShardedCache[type, ObjectRedactionPlan] = ShardedCache(
+            maxsize=self.config.object_plan_cache_size,
+        )
+        self._string_memo: ShardedCache[str, str] | None = None
+        if self.config.string_memo_size:
+            self._string_memo = ShardedCache(maxsize=self.config.string_memo_size, cache_factory=BoundedClockCache)
+        self._exception_cache: ShardedCache[tuple[type[BaseException], str], str] | None = None
+        if self.config.exception_cache_size:
+            self._exception_cache = ShardedCache(maxsize=self.config.exception_cache_size)
+        self._instrumentation = RedactionInstrumentation() if self.config.instrumentation else None
+
+    @property
+    def key_cache_stats(self) -> CacheStats:
+        return self._key_cache.stats()
+
+    @property
+    def object_plan_cache_stats(self) -> CacheStats:
+        return self._object_plans.stats()
+
+    @property
+    def string_memo_stats(self) -> CacheStats | None:
+        """Hit ratio of the repeated-string memo, or `None` unless `config.string_memo_size` is set."""
+        return None if self._string_memo is None else self._string_memo.stats()
+
+    @property
+    def exception_cache_stats(self) -> CacheStats | None:
+        """Hit ratio of the exception message cache, or `None` when `config.exception_cache_size` is `0`."""
+        return None if self._exception_cache is None else self._exception_cache.stats()
+
+    @property
+    def string_rule_stats(self) -> StringRuleStats:
+        cells = self._string_rule_counters.cells()
+        screened, *skipped = (sum(column) for column in zip([0] * (len(STRING_RULES) + 1), *cells, strict=True))
+        return StringRuleStats(screened=screened, skipped=dict(zip(STRING_RULES, skipped, strict=True)))
+
+    @property
+    def safe_key_stats(self) -> SafeKeyStats:
+        """Allowlist hit rate; only counted when `config.safe_keys` is set."""
+        cells = self._safe_key_counters.cells()
+        values, hits, chars_skipped = (sum(column) for column in zip([0, 0, 0], *cells, strict=True))
+        return SafeKeyStats(values=values, hits=hits, chars_skipped=chars_skipped)
+
+    @property
+    def redaction_stats(self) -> RedactionStats | None:
+        """Snapshot of the instrumentation counters, or `None` unless `config.instrumentation` is enabled."""
+        return None if self._instrumentation is None else self._instrumentation.snapshot()
 
     def __call__(self, record: MutableMapping[str, Any]) -> None:
         self.redact_record(record=record)
 
     def redact_record(self, record: MutableMapping[str, Any]) -> None:
+        if self.has_redaction_marker(record=record):
+            return
         try:
-            record["message"] = self._redact_string(value=str(object=record.get("message", "")))
-            record["extra"] = self._redact_value(value=record.get("extra", {}), key="", depth=0)
-            self._redact_exception(record=record)
+            budget = self._new_budget()
+            record["message"] = self._redact_budgeted_string(
+                value=str(object=record.get("message", "")),
+                budget=budget,
+            )
+            record["extra"] = self._redact_extra(extra=record.get("extra", {}), budget=budget)
+            self._redact_exception(record=record, budget=budget)
+            if budget is not None and budget.exceeded:
+                self._mark_budget_exceeded(record=record, budget=budget)
+            if self.config.provenance_marker:
+                self._mark_redacted(record=record)
         except Exception:
+            if self._instrumentation is not None:
+                self._instrumentation.record_redaction_error()
             record["message"] = self.REDACTION_ERROR
             record["extra"] = {"redaction_error": self.REDACTION_ERROR}
             record["exception"] = RecordException(
@@ -125,154 +691,1147 @@ class PhiPiiLogRedactor:
                 traceback=None,
             )
 
-    def _redact_value(self, value: object, *, key: str, depth: int, in_result_payload: bool = False) -> object:
-        if depth > self.REDACTION_DEPTH:
+    def redact_text(self, value: str) -> str:
+        """Apply the string rules to free text outside a record, such as a formatted traceback."""
+        return self._redact_string(value=value)
+
+    def redact_value(self, value: object) -> object:
+        """Redact a value outside a record, such as one entry of an exported log file, within the record budgets."""
+        return self._redact_value(value=value, key="", depth=0, budget=self._new_budget())
+
+    def redact_stream(
+        self,
+        chunks: Iterable[str | bytes | memoryview],
+        *,
+        encoding: str = "utf-8",
+        segment_chars: int = DEFAULT_STREAM_SEGMENT_CHARS,
+        overlap_chars: int = DEFAULT_STREAM_OVERLAP_CHARS,
+    ) -> Iterator[str]:
+        """Apply the string rules to text arriving in chunks, yielding redacted text about `segment_chars` at a time.
+
+        Byte chunks are decoded one at a time, and only the text not yet yielded is held. Each segment ends just
+        after whitespace or one of `,;}]`, which no secret, bearer token or email contains, so those are never split
+        however long they are. The cut is also one where redacting the `overlap_chars` on both sides together gives
+        the same result as redacting them apart, so other matches shorter than `overlap_chars` are caught across
+        chunk and segment ends. Where runs of matches leave no such cut, more text is held, up to
+        `STREAM_MAX_HELD_SEGMENTS` segments, before cutting anyway.
+
+        A keyed value or result call the segment's redaction ran to its end is redacted however long it is: the
+        text after the cut is dropped up to the value's closing delimiter, and the stream goes on from there. A cut
+        made anyway never splits a secret or bearer token either; when the held text has no such cut, because one
+        token or run without those characters is longer than it, the held text and the rest of that run are
+        replaced with one `REDACTED`, as they cannot be redacted in bounded memory.
+        """
+        if not 0 < overlap_chars < segment_chars:
+            msg = f"overlap_chars must be between 0 and segment_chars, got {overlap_chars} and {segment_chars}"
+            raise ValueError(msg)
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        pending = ""
+        # Offset in `pending` up to which cuts were already tried for the current segment.
+        searched = 0
+        # Values the last segment ended inside, innermost first; their text is dropped until each one closes.
+        open_values: list[OpenStreamValue] = []
+        for chunk in chunks:
+            pending += chunk if isinstance(chunk, str) else decoder.decode(chunk)
+            start = self._skip_open_stream_values(open_values=open_values, text=pending, start=0)
+            while len(pending) - start >= segment_chars + overlap_chars:
+                cut = self._find_stream_cut(
+                    text=pending,
+                    start=start,
+                    searched=searched,
+                    segment_chars=segment_chars,
+                    overlap_chars=overlap_chars,
+                )
+                if cut is None and len(pending) - start < STREAM_MAX_HELD_SEGMENTS * segment_chars:
+                    searched = len(pending) - overlap_chars
+                    break
+                cut = cut or self._find_forced_stream_cut(text=pending, start=start, segment_chars=segment_chars)
+                if cut is None:
+                    # A token longer than the held text, or text without a break: dropped whole, through its run.
+                    yield self.REDACTED
+                    open_values = [OpenStreamValue(run=True)]
+                    start = searched = self._skip_open_stream_values(
+                        open_values=open_values,
+                        text=pending,
+                        start=len(pending),
+                    )
+                    continue
+                segment = pending[start:cut]
+                redacted = self._redact_string(value=segment)
+                yield redacted
+                # Only a value redacted up to the end of the segment can have been open there.
+                if redacted.endswith(self.REDACTED):
+                    open_values = self._find_open_stream_values(value=segment)
+                start = searched = self._skip_open_stream_values(open_values=open_values, text=pending, start=cut)
+            pending = pending[start:]
+            searched = max(searched - start, 0)
+        pending += decoder.decode(b"", final=True)
+        start = self._skip_open_stream_values(open_values=open_values, text=pending, start=0)
+        if start < len(pending):
+            yield self._redact_string(value=pending[start:])
+
+    def _find_open_stream_values(self, value: str) -> list[OpenStreamValue]:
+        """Return the result call and keyed value `_redact_string` redacted up to the end of `value`, innermost first.
+
+        Each is looked for in the text its pass of `_apply_string_rules` reads: result calls after the families
+        before them, keyed values after result calls too.
+        """
+        open_values: list[OpenStreamValue] = []
+        before_results = self._apply_string_rules(value=value, rules=PRE_RESULT_STRING_RULES)
+        # Only the last call and keyed value can reach the end; a deque of one keeps just that.
+        calls = deque(self._iter_result_object_calls(value=before_results), maxlen=1)
+        if calls and calls[0][2] == len(before_results):
+            call = OpenStreamValue(parens_only=True)
+            if call.find_end(text=before_results, start=calls[0][1]) is None:
+                open_values.append(call)
+        before_keyed = self._redact_test_result_objects(value=before_results)
+        keyed_values = deque(self._iter_sensitive_keyed_values(value=before_keyed), maxlen=1)
+        if keyed_values and keyed_values[0][2] == len(before_keyed):
+            match, classification, _ = keyed_values[0]
+            keyed = OpenStreamValue(url=classification.is_url)
+            if keyed.find_end(text=before_keyed, start=match.end()) is None:
+                open_values.append(keyed)
+        return open_values
+
+    @staticmethod
+    def _skip_open_stream_values(open_values: list[OpenStreamValue], text: str, start: int) -> int:
+        """Drop the text of `open_values` from `start`, removing each one that closes; return where `text` goes on."""
+        while open_values:
+            end = open_values[0].find_end(text=text, start=start)
+            if end is None:
+                return len(text)
+            del open_values[0]
+            start = end
+        return start
+
+    def _find_stream_cut(
+        self,
+        text: str,
+        *,
+        start: int,
+        searched: int,
+        segment_chars: int,
+        overlap_chars: int,
+    ) -> int | None:
+        """Return the first safe cut near `start + segment_chars`, then after it, or `None` if the text has none."""
+        step = max(overlap_chars // (STREAM_CUT_ATTEMPTS - 1), 1)
+        target = start + segment_chars
+        # A full overlap back from `target`, so any shorter match crossing it starts after one of these.
+        positions = [target - attempt * step for attempt in range(STREAM_CUT_ATTEMPTS)] if searched <= target else []
+        positions.extend(range(max(target, searched) + step, len(text) - overlap_chars + 1, step))
+        for position in positions:
+            lowest = max(position - step, start + 1)
+            # After a line break, or else a space, where there is one nearby: most matches cannot span them.
+            cut = (
+                text.rfind("\n", lowest, position) + 1
+                or text.rfind(" ", lowest, position) + 1
+                or self._find_last_stream_break(text=text, start=lowest, end=position)
+            )
+            if cut is None:
+                continue
+            window_start = max(cut - overlap_chars, 0)
+            window = text[window_start : cut + overlap_chars]
+            redacted = self._redact_string(value=window)
+            split = cut - window_start
+            if redacted is window or (
+                self._redact_string(value=window[:split]) + self._redact_string(value=window[split:]) == redacted
+            ):
+                return cut
+        return None
+
+    def _find_forced_stream_cut(self, text: str, start: int, segment_chars: int) -> int | None:
+        """Return the last break within a segment of `start` that no secret or bearer token spans, else the first one
+        after it; `None` if the held text has none.
+        """
+        spans = sorted(
+            match.span()
+            for pattern in (self.secret_value_pattern, self.bearer_token_pattern)
+            for match in pattern.finditer(text, start)
+        )
+        # Merged into disjoint, ordered spans, so one pointer tracks the span each break could fall inside.
+        merged: list[list[int]] = []
+        for span_start, span_end in spans:
+            if merged and span_start < merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], span_end)
+            else:
+                merged.append([span_start, span_end])
+        target = start + segment_chars
+        found = None
+        index = 0
+        for match in OpenStreamValue.BREAK_PATTERN.finditer(text, start):
+            cut = match.end()
+            while index < len(merged) and merged[index][1] <= cut:
+                index += 1
+            if index < len(merged) and merged[index][0] < cut:
+                continue
+            if cut > target:
+                return found or cut
+            found = cut
+        return found
+
+    @staticmethod
+    def _find_last_stream_break(text: str, start: int, end: int) -> int | None:
+        """Return the index just past the last `OpenStreamValue.BREAK_PATTERN` character in `text[start:end]`."""
+        breaks = deque(OpenStreamValue.BREAK_PATTERN.finditer(text, start, end), maxlen=1)
+        return breaks[0].end() if breaks else None
+
+    def sink_filter(
+        self,
+        filter_: Callable[[MutableMapping[str, Any]], bool] | None = None,
+    ) -> Callable[[MutableMapping[str, Any]], bool]:
+        """Build a sink `filter` that redacts a record only once that sink accepts it.
+
+        Loguru runs patchers on every record that reaches the lowest sink level, before each sink's own filter, so
+        records every sink then rejects (a per-module level, say) are redacted for nothing. Install `withhold_record`
+        as the patcher instead of the redactor and pass this to every sink; `filter_` is the sink's own filter and
+        runs first, on the original record:
+
+            logger.configure(patcher=redactor.withhold_record)
+            logger.add(sys.stderr, level="INFO", filter=redactor.sink_filter(filter_=only_our_modules))
+
+        The first accepting sink puts the withheld fields back, redacts the record in place and sets
+        `REDACTION_MARKER_KEY` on the record itself (not on its `extra`, so formats that show `{extra}` are unchanged);
+        later sinks reuse it. A sink without this filter, `RedactingJsonSink` included, gets the redacted record only if
+        a filtered sink accepted it first; otherwise, say when the record is below every filtered sink's level, it gets
+        the placeholders `withhold_record` left. Without that patcher, it would get the unredacted record.
+        """
+
+        def redacting_filter(record: MutableMapping[str, Any]) -> bool:
+            if self.has_redaction_marker(record=record):
+                return filter_ is None or filter_(record)
+            withheld = self._restore_withheld(record=record)
+            if filter_ is not None and not filter_(record):
+                if withheld:
+                    self.withhold_record(record=record)
+                return False
+            # Marked in-band rather than remembered here, so no record (and its traceback's locals) outlives its call.
+            self.redact_record(record=record)
+            self._mark_redacted(record=record)
+            return True
+
+        return redacting_filter
+
+    def withhold_record(self, record: MutableMapping[str, Any]) -> None:
+        """Patcher that sets a record's message, extra and exception aside until a `sink_filter` accepts it.
+
+        Nothing is scanned here; sinks without the filter see `REDACTED`, an empty `extra` and no exception.
+        """
+        if self.has_redaction_marker(record=record) or WITHHELD_FIELDS_KEY in record:
+            return
+        record[WITHHELD_FIELDS_KEY] = WithheldRecordFields(
+            message=record.get("message", ""),
+            extra=record.get("extra", {}),
+            exception=record.get("exception"),
+        )
+        record["message"] = self.REDACTED
+        record["extra"] = {}
+        record["exception"] = None
+
+    @staticmethod
+    def _restore_withheld(record: MutableMapping[str, Any]) -> bool:
+        withheld = record.pop(WITHHELD_FIELDS_KEY, None)
+        if not isinstance(withheld, WithheldRecordFields):
+            return False
+        record["message"] = withheld.message
+        record["extra"] = withheld.extra
+        record["exception"] = withheld.exception
+        return True
+
+    def _new_budget(self) -> RedactionBudget | None:
+        config = self.config
+        if config.max_string_chars is None and config.max_nodes is None and config.max_collection_items is None:
+            return None
+        return RedactionBudget(
+            string_chars=config.max_string_chars,
+            nodes=config.max_nodes,
+            collection_items=config.max_collection_items,
+        )
+
+    def _mark_budget_exceeded(self, record: MutableMapping[str, Any], budget: RedactionBudget) -> None:
+        extra = record.get("extra")
+        if isinstance(extra, Mapping):
+            record["extra"] = {**extra, self.REDACTION_BUDGET_KEY: sorted(budget.exceeded)}
+
+    def has_redaction_marker(self, record: Mapping[str, Any]) -> bool:
+        """Whether this redactor already redacted and marked `record`."""
+        return record.get(REDACTION_MARKER_KEY) == self.redaction_marker
+
+    def _mark_redacted(self, record: MutableMapping[str, Any]) -> None:
+        record[REDACTION_MARKER_KEY] = self.redaction_marker
+
+    def _redact_budgeted_string(self, value: str, budget: RedactionBudget | None) -> str:
+        if budget is not None and not budget.take_string(value=value):
+            return self.REDACTED
+        return self._redact_string(value=value)
+
+    def _summarize_truncated(self, count: int, types: tuple[str, ...] = ()) -> str:
+        if types:
+            return self.SUMMARIZED_ITEMS.format(count=count, types=", ".join(types))
+        return self.TRUNCATED_ITEMS.format(count=count)
+
+    @staticmethod
+    def _get_truncated_types(items: list[object] | tuple[object, ...], limit: int) -> tuple[str, ...]:
+        """Sorted type names of the items past `limit`, read from at most `SUMMARY_TYPE_SAMPLE_SIZE` of them."""
+        sample = islice(items, limit, limit + SUMMARY_TYPE_SAMPLE_SIZE)
+        return tuple(sorted({type(item).__name__ for item in sample}))
+
+    def _redact_extra(self, extra: object, budget: RedactionBudget | None = None) -> object:
+        context = logger_context.get()
+        if not context or not isinstance(extra, dict):
+            return self._redact_value(value=extra, key="", depth=0, budget=budget)
+        root = self._build_mapping_frame(
+            value=extra,
+            parent=self._classify_key(key=""),
+            depth=0,
+            in_result_payload=False,
+            budget=budget,
+        )
+        root.context_memo = self._get_context_memo(context=context)
+        return self._walk(stack=[root], budget=budget)
+
+    def _get_context_memo(self, context: dict[str, Any]) -> ContextRedactionMemo:
+        # Loguru swaps in a new context dict for every `contextualize()` scope, so identity marks the scope.
+        memo = self._context_memo.get()
+        if memo is None or memo.context is not context:
+            memo = ContextRedactionMemo(context=context)
+            self._context_memo.set(memo)
+        return memo
+
+    def _redact_value(
+        self,
+        value: object,
+        *,
+        key: object,
+        depth: int,
+        in_result_payload: bool = False,
+        budget: RedactionBudget | None = None,
+    ) -> object:
+        return self._redact_classified_value(
+            value=value,
+            classification=self._classify_key(key=key),
+            depth=depth,
+            in_result_payload=in_result_payload,
+            budget=budget,
+        )
+
+    def _redact_classified_value(
+        self,
+        value: object,
+        *,
+        classification: KeyClassification,
+        depth: int,
+        in_result_payload: bool,
+        budget: RedactionBudget | None = None,
+    ) -> object:
+        stack: list[RedactionFrame] = []
+        redacted = self._redact_node(
+            value=value,
+            classification=classification,
+            depth=depth,
+            in_result_payload=in_result_payload,
+            budget=budget,
+            stack=stack,
+        )
+        return self._walk(stack=stack, budget=budget) if redacted is PENDING else redacted
+
+    def _walk(self, stack: list[RedactionFrame], budget: RedactionBudget | None) -> object:
+        """Redact the containers on `stack` depth-first, children in order, without recursing per level.
+
+        Pushing a child container suspends the current frame at its `index`; the child's finished value is then
+        handed back to the parent, which resumes from the next child.
+        """
+        frame = stack[-1]
+        while True:
+            values = frame.values
+            classifications = frame.classifications
+            scalar_types = frame.scalar_types
+            # Without a budget, special mapping rules, depth cut-off or result payload, a child under a plain key
+            # only needs the string rules or its own frame, so it skips `_redact_node`.
+            plain_children = (
+                budget is None
+                and not frame.in_result_payload
+                and not frame.has_special_children
+                and frame.child_depth <= self.REDACTION_DEPTH
+            )
+            redacted_items = frame.redacted
+            index = frame.index
+            while index < len(values):
+                child = values[index]
+                classification = classifications[index]
+                plain = plain_children and classification.is_plain
+                if plain and type(child) in scalar_types:
+                    redacted = child
+                elif plain and isinstance(child, str):
+                    redacted = self._redact_string(value=child)
+                else:
+                    redacted = (
+                        self._redact_plain_container(
+                            value=child,
+                            classification=classification,
+                            depth=frame.child_depth,
+                            stack=stack,
+                        )
+                        if plain and type(child) in PLAIN_CONTAINER_TYPES
+                        else self._redact_frame_child(frame=frame, index=index, budget=budget, stack=stack)
+                    )
+                    if redacted is PENDING:
+                        break
+                if redacted_items is not None:
+                    redacted_items.append(redacted)
+                elif redacted is not child:
+                    redacted_items = [*values[:index], redacted]
+                index += 1
+            else:
+                frame.redacted = redacted_items
+                stack.pop()
+                redacted = self._finish_frame(frame=frame)
+                if not stack:
+                    return redacted
+                frame = stack[-1]
+                frame.accept(redacted=redacted)
+                continue
+
+            frame.index = index
+            frame.redacted = redacted_items
+            frame = stack[-1]
+
+    def _record_safe_keys(self, classifications: list[KeyClassification], values: list[object]) -> None:
+        hits = chars_skipped = 0
+        for classification, value in zip(classifications, values, strict=True):
+            if classification.is_safe and type(value) in SAFE_SCALAR_TYPES:
+                hits += 1
+                chars_skipped += len(value) if type(value) is str else 0
+        counters = self._safe_key_counters.get()
+        counters[0] += len(values)
+        counters[1] += hits
+        counters[2] += chars_skipped
+
+    def _redact_frame_child(
+        self,
+        frame: RedactionFrame,
+        index: int,
+        budget: RedactionBudget | None,
+        stack: list[RedactionFrame],
+    ) -> object:
+        child = frame.values[index]
+        classification = frame.classifications[index]
+        if frame.keys is not None:
+            if classification.is_safe and type(child) in SAFE_SCALAR_TYPES:
+                return child
+            if frame.address_payload and classification.is_address_child:
+                if self._instrumentation is not None:
+                    self._instrumentation.record_key_rule(key_class="address")
+                return self.REDACTED
+            context_memo = frame.context_memo
+            if context_memo is not None:
+                key = cast("list[object]", frame.keys)[index]
+                if self._is_memoizable_context_value(context=context_memo.context, key=key, value=child):
+                    return self._redact_context_value(
+                        value=child,
+                        memo=context_memo,
+                        memo_key=(str(object=key), frame.in_result_payload),
+                        classification=classification,
+                        depth=frame.child_depth,
+                        budget=budget,
+                    )
+        return self._redact_node(
+            value=child,
+            classification=classification,
+            depth=frame.child_depth,
+            in_result_payload=frame.in_result_payload,
+            budget=budget,
+            stack=stack,
+        )
+
+    def _redact_node(
+        self,
+        value: object,
+        *,
+        classification: KeyClassification,
+        depth: int,
+        in_result_payload: bool,
+        budget: RedactionBudget | None,
+        stack: list[RedactionFrame],
+    ) -> object:
+        """Redact a scalar directly, or push a frame for a container and return `PENDING`."""
+        if depth > self.REDACTION_DEPTH or (budget is not None and not budget.take_value(value=value)):
             return self.REDACTED
 
-        normalized_key = self._normalize_key(key=key)
         should_return_direct_value, direct_value = self._get_direct_redacted_value(
-            normalized_key=normalized_key,
+            classification=classification,
             value=value,
         )
         if should_return_direct_value:
+            if self._instrumentation is not None and direct_value is not value:
+                self._record_key_rule(classification=classification)
             return direct_value
-        if self._should_redact_key(normalized_key=normalized_key, in_result_payload=in_result_payload):
+        if classification.redacts_value(in_result_payload=in_result_payload):
+            if self._instrumentation is not None:
+                self._record_key_rule(classification=classification)
             return self.REDACTED
 
         if isinstance(value, str):
             return self._redact_string_value(
                 value=value,
-                normalized_key=normalized_key,
+                classification=classification,
                 in_result_payload=in_result_payload,
             )
+        return self._redact_container(
+            value=value,
+            classification=classification,
+            depth=depth,
+            in_result_payload=in_result_payload,
+            budget=budget,
+            stack=stack,
+        )
 
+    def _redact_container(
+        self,
+        value: object,
+        *,
+        classification: KeyClassification,
+        depth: int,
+        in_result_payload: bool,
+        budget: RedactionBudget | None,
+        stack: list[RedactionFrame],
+    ) -> object:
+        """Redact a flat dict or an unplanned object directly, or push a frame for it and return `PENDING`."""
+        if budget is None and type(value) is dict and self._is_flat_mapping(value=value):
+            return self._redact_flat_mapping(
+                value=value,
+                parent=classification,
+                depth=depth,
+                in_result_payload=in_result_payload,
+            )
         if isinstance(value, Mapping):
-            return self._redact_mapping(
+            frame = self._build_mapping_frame(
                 value=value,
+                parent=classification,
                 depth=depth,
-                parent_key=normalized_key,
                 in_result_payload=in_result_payload,
+                budget=budget,
             )
-
-        return self._redact_collection_or_object(
-            value=value,
-            key=key,
-            depth=depth,
-            in_result_payload=in_result_payload,
-        )
-
-    def _redact_collection_or_object(self, value: object, *, key: str, depth: int, in_result_payload: bool) -> object:
-        if isinstance(value, (list, set)):
-            redacted_value = self._redact_items(
-                values=value,
-                key=key,
+        elif isinstance(value, (list, set)) or (isinstance(value, tuple) and not self._is_namedtuple_type(type(value))):
+            frame = self._build_sequence_frame(
+                value=value,
+                classification=classification,
                 depth=depth,
                 in_result_payload=in_result_payload,
+                budget=budget,
             )
-        elif isinstance(value, tuple):
-            redacted_value = tuple(
-                self._redact_items(
-                    values=value,
-                    key=key,
+        else:
+            plan = self._get_object_plan(value=value)
+            # A model dump turns nested models into plain dicts, so inside a planned object they are framed at their
+            # own depth on the same stack; anywhere else an object sits one level above its fields.
+            if plan is None or not stack or not stack[0].in_object:
+                return self._redact_object(
+                    value=value,
+                    plan=plan,
+                    classification=classification,
                     depth=depth,
                     in_result_payload=in_result_payload,
-                ),
-            )
-        else:
-            redacted_value = self._redact_object(
+                    budget=budget,
+                )
+            frame = self._build_object_frame(
                 value=value,
-                key=key,
+                plan=plan,
+                parent=classification,
                 depth=depth,
                 in_result_payload=in_result_payload,
+                budget=budget,
             )
+        stack.append(frame)
+        return PENDING
 
-        return redacted_value
+    def _redact_plain_container(
+        self,
+        value: object,
+        classification: KeyClassification,
+        depth: int,
+        stack: list[RedactionFrame],
+    ) -> object:
+        """Redact a flat dict under a plain key directly, or push a frame for any other plain container."""
+        if type(value) is dict and self._is_flat_mapping(value=value):
+            return self._redact_flat_mapping(value=value, parent=classification, depth=depth, in_result_payload=False)
+        stack.append(self._build_frame(value=value, classification=classification, depth=depth))
+        return PENDING
 
-    def _redact_string_value(self, value: str, *, normalized_key: str, in_result_payload: bool) -> str:
-        if in_result_payload and not self._is_loggable_result_payload_key(normalized_key=normalized_key):
+    @staticmethod
+    def _is_flat_mapping(value: dict[object, object]) -> bool:
+        return all(type(item) in SAFE_SCALAR_TYPES for item in value.values())
+
+    def _redact_flat_mapping(
+        self,
+        value: dict[object, object],
+        *,
+        parent: KeyClassification,
+        depth: int,
+        in_result_payload: bool,
+    ) -> dict[object, object]:
+        """Redact a dict of builtin scalars outside budgets in one pass, with the rules `_walk` applies to its frame.
+
+        Most payloads end in small flat dicts, where building, walking and finishing a frame costs more than the
+        redaction itself.
+        """
+        keys = list(value.keys())
+        values = list(value.values())
+        classifications = [self._classify_key(key=key) for key in keys]
+        if self._safe_key_classifications:
+            self._record_safe_keys(classifications=classifications, values=values)
+        result_payload = (
+            in_result_payload
+            or parent.is_result_container
+            or self._looks_like_result_payload(classifications=classifications)
+        )
+        address_payload = parent.is_address_container
+        child_depth = depth + 1
+        plain_children = not result_payload and not address_payload and child_depth <= self.REDACTION_DEPTH
+        redacted_items: list[object] | None = None
+        for index, child in enumerate(values):
+            classification = classifications[index]
+            if plain_children and classification.is_plain:
+                redacted = self._redact_string(value=child) if type(child) is str else child
+            elif classification.is_safe:
+                redacted = child
+            elif address_payload and classification.is_address_child:
+                if self._instrumentation is not None:
+                    self._instrumentation.record_key_rule(key_class="address")
+                redacted = self.REDACTED
+            else:
+                # Scalars never push a frame, so the stack stays empty.
+                redacted = self._redact_node(
+                    value=child,
+                    classification=classification,
+                    depth=child_depth,
+                    in_result_payload=result_payload,
+                    budget=None,
+                    stack=[],
+                )
+            if redacted_items is not None:
+                redacted_items.append(redacted)
+            elif redacted is not child:
+                redacted_items = [*values[:index], redacted]
+        if redacted_items is None:
+            return value
+        return dict(zip(keys, redacted_items, strict=True))
+
+    def _build_frame(self, value: object, classification: KeyClassification, depth: int) -> RedactionFrame:
+        """Frame a plain dict, list or tuple child outside result payloads and budgets."""
+        if isinstance(value, dict):
+            return self._build_mapping_frame(
+                value=value,
+                parent=classification,
+                depth=depth,
+                in_result_payload=False,
+                budget=None,
+            )
+        return self._build_sequence_frame(
+            value=cast("list[object] | tuple[object, ...]", value),
+            classification=classification,
+            depth=depth,
+            in_result_payload=False,
+            budget=None,
+        )
+
+    def _build_mapping_frame(
+        self,
+        value: Mapping[object, object],
+        *,
+        parent: KeyClassification,
+        depth: int,
+        in_result_payload: bool,
+        budget: RedactionBudget | None,
+    ) -> RedactionFrame:
+        limit = len(value) if budget is None else budget.item_limit(count=len(value))
+        if limit == len(value):
+            keys, values = list(value.keys()), list(value.values())
+        else:
+            keys, values = list(islice(value.keys(), limit)), list(islice(value.values(), limit))
+        classifications = [self._classify_key(key=key) for key in keys]
+        if self._safe_key_classifications:
+            self._record_safe_keys(classifications=classifications, values=values)
+        truncated = len(value) - limit
+        # Keys past the budget are never classified, so a truncated mapping is treated as a result payload.
+        result_payload = (
+            in_result_payload
+            or parent.is_result_container
+            or truncated > 0
+            or self._looks_like_result_payload(classifications=classifications)
+        )
+        return RedactionFrame(
+            source=value,
+            values=values,
+            keys=keys,
+            classifications=classifications,
+            child_depth=depth + 1,
+            in_result_payload=result_payload,
+            truncated=truncated,
+            address_payload=parent.is_address_container,
+        )
+
+    def _build_sequence_frame(
+        self,
+        value: list[object] | tuple[object, ...] | set[object],
+        *,
+        classification: KeyClassification,
+        depth: int,
+        in_result_payload: bool,
+        budget: RedactionBudget | None,
+    ) -> RedactionFrame:
+        # Sets and list subclasses come back as plain lists, tuple subclasses as plain tuples.
+        items = value if type(value) is list or isinstance(value, tuple) else list(value)
+        summary_items = self.config.collection_summary_items
+        limit = len(items) if summary_items is None else min(len(items), summary_items)
+        if budget is not None:
+            limit = budget.item_limit(count=limit)
+        return RedactionFrame(
+            source=value,
+            values=items if limit == len(items) else items[:limit],
+            classifications=[classification] * limit,
+            child_depth=depth + 1,
+            in_result_payload=in_result_payload,
+            truncated=len(items) - limit,
+            truncated_types=(
+                () if summary_items is None or limit == len(items) else self._get_truncated_types(items, limit=limit)
+            ),
+        )
+
+    def _finish_frame(self, frame: RedactionFrame) -> object:
+        redacted = frame.redacted
+        if frame.keys is not None:
+            if redacted is None and not frame.truncated and type(frame.source) is dict:
+                return frame.source
+            redacted_mapping = dict(zip(frame.keys, frame.values if redacted is None else redacted, strict=True))
+            if frame.truncated:
+                redacted_mapping[self.TRUNCATED] = self._summarize_truncated(count=frame.truncated)
+            return redacted_mapping
+
+        if frame.truncated:
+            redacted = [*(frame.values if redacted is None else redacted)]
+            redacted.append(self._summarize_truncated(count=frame.truncated, types=frame.truncated_types))
+        if isinstance(frame.source, tuple):
+            return self._rebuild_tuple(value=frame.source, redacted_items=redacted)
+        return frame.values if redacted is None else redacted
+
+    @staticmethod
+    def _rebuild_tuple(value: tuple[object, ...], redacted_items: list[object] | None) -> tuple[object, ...]:
+        if redacted_items is not None:
+            return tuple(redacted_items)
+        return value if type(value) is tuple else tuple(value)
+
+    def _redact_string_value(self, value: str, *, classification: KeyClassification, in_result_payload: bool) -> str:
+        if in_result_payload and not classification.is_loggable_result_payload:
+            if self._instrumentation is not None:
+                self._instrumentation.record_key_rule(key_class="result_payload")
             return self.REDACTED
         return self._redact_string(value=value)
 
-    def _redact_items(
+    def _redact_object(
         self,
-        values: list[object] | tuple[object, ...] | set[object],
+        value: object,
         *,
-        key: str,
+        plan: ObjectRedactionPlan | None,
+        classification: KeyClassification,
         depth: int,
         in_result_payload: bool,
-    ) -> list[object]:
-        return [
-            self._redact_value(
-                value=item,
-                key=key,
-                depth=depth + 1,
+        budget: RedactionBudget | None,
+    ) -> object:
+        if isinstance(value, Exception):
+            return self._redact_budgeted_string(value=str(object=value), budget=budget)
+
+        if plan is not None:
+            return self._redact_planned_object(
+                value=value,
+                plan=plan,
+                classification=classification,
+                depth=depth,
                 in_result_payload=in_result_payload,
+                budget=budget,
             )
-            for item in values
-        ]
-
-    def _redact_object(self, value: object, *, key: str, depth: int, in_result_payload: bool) -> object:
-        if isinstance(value, Exception):
-            return self._redact_string(value=str(object=value))
 
         model_dump = getattr(value, "model_dump", None)
         if not callable(model_dump):
             return value
 
+        # Models walk their dump separately so a failure anywhere inside falls back to the model's string.
         try:
-            return self._redact_value(
+            return self._redact_classified_value(
                 value=model_dump(mode="python"),
-                key=key,
+                classification=classification,
                 depth=depth + 1,
                 in_result_payload=in_result_payload,
+                budget=budget,
             )
         except Exception:
-            return self._redact_string(value=str(object=value))
+            return self._redact_budgeted_string(value=str(object=value), budget=budget)
 
-    def _redact_mapping(
-        self, value: Mapping[object, object], *, depth: int, parent_key: str, in_result_payload: bool
-    ) -> dict[object, object]:
-        child_keys = {self._normalize_key(key=item_key) for item_key in value}
-        result_payload = (
-            in_result_payload
-            or self._is_test_result_container_key(normalized_key=parent_key)
-            or self._looks_like_result_payload(keys=child_keys)
+    def _redact_planned_object(
+        self,
+        value: object,
+        *,
+        plan: ObjectRedactionPlan,
+        classification: KeyClassification,
+        depth: int,
+        in_result_payload: bool,
+        budget: RedactionBudget | None,
+    ) -> object:
+        # The field mapping sits one level below the object, like a model dump, and is walked on its own stack so
+        # a failure anywhere inside falls back to the object's string.
+        if depth + 1 > self.REDACTION_DEPTH or (budget is not None and not budget.take_node()):
+            return self.REDACTED
+        try:
+            frame = self._build_object_frame(
+                value=value,
+                plan=plan,
+                parent=classification,
+                depth=depth + 1,
+                in_result_payload=in_result_payload,
+                budget=budget,
+            )
+            return self._walk(stack=[frame], budget=budget)
+        except Exception:
+            return self._redact_budgeted_string(value=str(object=value), budget=budget)
+
+    def _build_object_frame(
+        self,
+        value: object,
+        *,
+        plan: ObjectRedactionPlan,
+        parent: KeyClassification,
+        depth: int,
+        in_result_payload: bool,
+        budget: RedactionBudget | None,
+    ) -> RedactionFrame:
+        limit = len(plan.fields) if budget is None else budget.item_limit(count=len(plan.fields))
+        keys: list[object] = [*plan.fields[:limit]]
+        # Budgets charge every field, so only an unbudgeted walk leaves always-redacted fields (and properties) unread.
+        values: list[object] = [
+            self.REDACTED if redacted and budget is None else getattr(value, name)
+            for name, redacted in zip(plan.fields[:limit], plan.always_redacted, strict=False)
+        ]
+        classifications = [*plan.classifications[:limit]]
+        if self._safe_key_classifications:
+            self._record_safe_keys(classifications=classifications, values=values)
+        truncated = len(plan.fields) - limit
+        return RedactionFrame(
+            source=value,
+            values=values,
+            classifications=classifications,
+            keys=keys,
+            child_depth=depth + 1,
+            in_result_payload=(
+                in_result_payload or parent.is_result_container or truncated > 0 or plan.is_result_payload
+            ),
+            truncated=truncated,
+            address_payload=parent.is_address_container,
+            scalar_types=plan.scalar_types,
+            in_object=True,
         )
-        address_payload = self._is_address_container_key(normalized_key=parent_key)
 
-        redacted: dict[object, object] = {}
-        for item_key, item_value in value.items():
-            normalized_item_key = self._normalize_key(key=item_key)
-            should_redact_address_child = address_payload and self._is_address_child_key(
-                normalized_key=normalized_item_key,
+    def _get_object_plan(self, value: object) -> ObjectRedactionPlan | None:
+        """Return the cached plan of a pydantic model, dataclass or namedtuple.
+
+        `None` for any other value, and for models that still need `model_dump()`: custom serializers or extra fields.
+        """
+        object_type = type(value)
+        if not (
+            issubclass(object_type, BaseModel) or is_dataclass(object_type) or self._is_namedtuple_type(object_type)
+        ):
+            return None
+        plan = self._object_plans.get(object_type)
+        if plan is None:
+            plan = self._build_object_plan(object_type=object_type)
+            self._object_plans.put(object_type, plan)
+        if plan.uses_model_dump or getattr(value, "__pydantic_extra__", None):
+            return None
+        return plan
+
+    def _build_object_plan(self, object_type: type) -> ObjectRedactionPlan:
+        names = self._get_plan_fields(object_type=object_type)
+        if names is None:
+            return ObjectRedactionPlan(
+                fields=(),
+                classifications=(),
+                always_redacted=(),
+                scalar_types=PLAIN_SCALAR_TYPES,
+                is_result_payload=False,
+                uses_model_dump=True,
             )
-            redacted[item_key] = (
-                self.REDACTED
-                if should_redact_address_child
-                else self._redact_value(
-                    value=item_value,
-                    key=str(object=item_key),
-                    depth=depth + 1,
-                    in_result_payload=result_payload,
-                )
+        classifications = tuple(self._classify_key(key=name) for name in names)
+        return ObjectRedactionPlan(
+            fields=names,
+            classifications=classifications,
+            always_redacted=tuple(classification.redacts_any_value for classification in classifications),
+            scalar_types=PLAIN_SCALAR_TYPES | self._get_unchanged_enum_types(object_type=object_type),
+            is_result_payload=self._looks_like_result_payload(classifications=[*classifications]),
+        )
+
+    @staticmethod
+    def _is_namedtuple_type(object_type: type) -> bool:
+        return issubclass(object_type, tuple) and isinstance(getattr(object_type, "_fields", None), tuple)
+
+    @staticmethod
+    def _get_plan_fields(object_type: type) -> tuple[str, ...] | None:
+        if issubclass(object_type, BaseModel):
+            return PhiPiiLogRedactor._get_model_plan_fields(model=object_type)
+        if is_dataclass(object_type):
+            return tuple(item.name for item in dataclass_fields(object_type))
+        return tuple(getattr(object_type, "_fields", ()))
+
+    @staticmethod
+    def _get_model_plan_fields(model: type[BaseModel]) -> tuple[str, ...] | None:
+        """Return the fields `model_dump()` emits, or `None` when anything but the stock dump could reshape them."""
+        decorators = model.__pydantic_decorators__
+        infos = [*model.model_fields.values(), *model.model_computed_fields.values()]
+        if (
+            model.model_dump is not BaseModel.model_dump
+            or model.__pydantic_root_model__
+            or model.model_config.get("serialize_by_alias")
+            or decorators.model_serializers
+            or decorators.field_serializers
+            or any(getattr(info, "exclude_if", None) is not None for info in infos)
+            or any(
+                isinstance(item, (PlainSerializer, WrapSerializer))
+                for info in infos
+                for item in getattr(info, "metadata", ())
             )
-        return redacted
+        ):
+            return None
+        return (
+            *(name for name, info in model.model_fields.items() if not info.exclude),
+            *model.model_computed_fields,
+        )
 
-    def _redact_string(self, value: str) -> str:
-        redacted = self.email_pattern.sub(
-            repl=lambda match: self._redact_email(email=match.group(0)),
-            string=value,
+    def _get_unchanged_enum_types(self, object_type: type) -> frozenset[type]:
+        """Return the enum field types of `object_type` whose members every rule leaves as-is under a plain key."""
+        if issubclass(object_type, BaseModel):
+            annotations = [info.annotation for info in object_type.model_fields.values()]
+            annotations += [info.return_type for info in object_type.model_computed_fields.values()]
+        else:
+            # Unresolved string annotations name no type and are skipped.
+            annotations = list(getattr(object_type, "__annotations__", {}).values())
+        return frozenset(
+            enum_type
+            for annotation in annotations
+            for enum_type in self._iter_enum_types(annotation=annotation)
+            if all(not isinstance(member, str) or self._redact_string(value=member) is member for member in enum_type)
         )
-        redacted = self._redact_url_userinfo_in_string(value=redacted)
-        redacted = self.bearer_token_pattern.sub(repl=f"Bearer {self.REDACTED}", string=redacted)
-        redacted = self.secret_value_pattern.sub(
-            repl=lambda match: (
-                f"{match.group('secret_key')}{match.group('secret_separator')}"
-                f"{match.group('secret_bearer') or ''}{self.REDACTED}"
-            ),
-            string=redacted,
+
+    @staticmethod
+    def _iter_enum_types(annotation: object) -> Iterator[type[Enum]]:
+        if isinstance(annotation, type) and issubclass(annotation, Enum):
+            yield annotation
+        for argument in get_args(annotation):
+            yield from PhiPiiLogRedactor._iter_enum_types(annotation=argument)
+
+    @staticmethod
+    def _is_memoizable_context_value(context: dict[str, Any], key: object, value: object) -> bool:
+        # A `bind()` or call-site kwarg that shadows a context key is a different object and is redacted afresh.
+        return (
+            isinstance(key, str)
+            and key in context
+            and context[key] is value
+            and isinstance(value, MEMOIZABLE_CONTEXT_TYPES)
+        )
+
+    def _redact_context_value(
+        self,
+        value: object,
+        *,
+        memo: ContextRedactionMemo,
+        memo_key: tuple[str, bool],
+        classification: KeyClassification,
+        depth: int,
+        budget: RedactionBudget | None,
+    ) -> object:
+        try:
+            return memo.values[memo_key]
+        except KeyError:
+            redacted = self._redact_classified_value(
+                value=value,
+                classification=classification,
+                depth=depth,
+                in_result_payload=memo_key[1],
+                budget=budget,
+            )
+            # A value cut short by this record's budget must not be reused for the rest of the scope.
+            if budget is None or not budget.exceeded:
+                memo.values[memo_key] = redacted
+            return redacted
+
+    def _redact_string(self, value: str, *, depth: int = 0) -> str:
+        memo = self._string_memo
+        # Nested calls redact fragments of a string being redacted; only whole strings are worth memoizing.
+        if memo is None or depth or len(value) > self.config.string_memo_max_chars:
+            return self._scan_string(value=value, depth=depth)
+        redacted = memo.get(key=value)
+        if redacted is None:
+            redacted = self._scan_string(value=value, depth=depth)
+            memo.put(key=value, value=redacted)
+        # Callers detect unchanged strings by identity, and a hit returns the object stored for an equal string.
+        return value if redacted == value else redacted
+
+    def _scan_string(self, value: str, *, depth: int) -> str:
+        rules = self._find_string_rule_candidates(value=value)
+        redacted = value
+        if rules and self._instrumentation is None:
+            redacted = self._apply_string_rules(value=value, rules=rules, depth=depth)
+        elif rules and self._instrumentation is not None:
+            redacted = self._apply_instrumented_string_rules(
+                value=value,
+                rules=rules,
+                depth=depth,
+                instrumentation=self._instrumentation,
+            )
+        if self._value_rule_pattern is not None:
+            redacted = self._apply_value_rules(value=redacted, pattern=self._value_rule_pattern)
+        return value if redacted == value else redacted
+
+    def _apply_value_rules(self, value: str, pattern: re.Pattern[str]) -> str:
+        """Replace the matches of every configured value rule in one pass, after the built-in families."""
+        if self._instrumentation is None:
+            return pattern.sub(repl=self._replace_value_rule_match, string=value)
+        started = time.perf_counter()
+        redacted = pattern.sub(repl=self._replace_value_rule_match, string=value)
+        self._instrumentation.record_rule(
+            rule="value_rules",
+            changed=redacted != value,
+            seconds=time.perf_counter() - started,
+            chars_scanned=len(value),
+        )
+        return redacted
+
+    def _replace_value_rule_match(self, match: re.Match[str]) -> str:
+        # The alternation takes the first rule matching at this position, so the first rule matching here alone
+        # is the one that matched.
+        for rule_pattern, replacement in self._value_rules:
+            if rule_pattern.match(match.string, match.start()) is not None:
+                return replacement
+        return self.REDACTED
+
+    def _apply_instrumented_string_rules(
+        self,
+        value: str,
+        rules: set[str],
+        *,
+        depth: int,
+        instrumentation: RedactionInstrumentation,
+    ) -> str:
+        # Each family runs on its own, in `STRING_RULES` order, so its matches and time are attributed to it alone.
+        redacted = value
+        for rule in STRING_RULES:
+            if rule not in rules:
+                continue
+            started = time.perf_counter()
+            result = self._apply_string_rules(value=redacted, rules=SINGLE_STRING_RULES[rule], depth=depth)
+            instrumentation.record_rule(
+                rule=rule,
+                changed=result != redacted,
+                seconds=time.perf_counter() - started,
+                chars_scanned=len(redacted),
+            )
+            redacted = result
+        return redacted
+
+    def _find_string_rule_candidates(self, value: str) -> set[str]:
+        possible = self._prescreen_string_rules(value=value)
+        rules = set(self._untriggered_string_rules)
+        if possible:
+            for match in self._get_string_rule_trigger_pattern(rules=possible).finditer(string=value):
+                rule = str(object=match.lastgroup)
+                rules.add(rule)
+                if rule in {"bearer", "secret"} and "keyed_value" in possible:
+                    # These triggers consume `key=` text the keyed-value trigger would otherwise have reported.
+                    rules.add("keyed_value")
+                if possible <= rules:
+                    break
+        self._record_string_rule_skips(rules=rules)
+        return rules
+
+    def _prescreen_string_rules(self, value: str) -> frozenset[str]:
+        """Rule families whose required literal characters all occur in `value`; the rest cannot match."""
+        has_at = "@" in value
+        has_separator = ":" in value or "=" in value
+        return (
+            PREFILTERED_STRING_RULES[
+                has_at
+                | (has_at and "://" in value) << 1
+                | (self.bearer_literal_pattern.search(string=value) is not None) << 2
+                | has_separator << 3
+                | ("(" in value) << 4
+                | has_separator << 5
+            ]
+            - self._untriggered_string_rules
         )
-        return self._redact_keyed_values_in_string(value=self._redact_test_result_objects(value=redacted))
+
+    def _get_string_rule_trigger_pattern(self, rules: frozenset[str]) -> re.Pattern[str]:
+        pattern = self._string_rule_trigger_patterns.get(rules)
+        if pattern is None:
+            pattern = re.compile(
+                pattern="|".join(
+                    f"(?P<{rule}>{self.string_rule_triggers[rule]})" for rule in STRING_RULES if rule in rules
+                ),
+                flags=re.IGNORECASE,
+            )
+            self._string_rule_trigger_patterns[rules] = pattern
+        return pattern
+
+    def _record_string_rule_skips(self, rules: set[str]) -> None:
+        counters = self._string_rule_counters.get()
+        counters[0] += 1
+        if len(rules) == len(STRING_RULES):
+            return
+        for index, rule in enumerate(STRING_RULES, start=1):
+            if rule not in rules:
+                counters[index] += 1
+
+    def _apply_string_rules(self, value: str, rules: set[str] | frozenset[str], *, depth: int = 0) -> str:
+        redacted = value
+        if "email" in rules:
+            redacted = self._redact_emails_in_string(value=redacted)
+        if "url_userinfo" in rules:
+            redacted = self._redact_url_userinfo_in_string(value=redacted)
+        if "bearer" in rules:
+            redacted = self.bearer_token_pattern.sub(repl=f"Bearer {self.REDACTED}", string=redacted)
+        if "secret" in rules:
+            redacted = self.secret_value_pattern.sub(
+                repl=lambda match: (
+                    f"{match.group('secret_key')}{match.group('secret_separator')}"
+                    f"{match.group('secret_bearer') or ''}{self.REDACTED}"
+                ),
+                string=redacted,
+            )
+        if "result_object" in rules:
+            redacted = self._redact_test_result_objects(value=redacted)
+        if "keyed_value" in rules:
+            redacted = self._redact_keyed_values_in_string(value=redacted, depth=depth)
+        return redacted
+
+    def _redact_emails_in_string(self, value: str) -> str:
+        if "email" in self._untriggered_string_rules:
+            return self.email_pattern.sub(repl=lambda match: self._redact_email(email=match.group(0)), string=value)
+        parts: list[str] = []
+        cursor = 0
+        for start, end in self._iter_email_spans(value=value):
+            parts.append(value[cursor:start])
+            parts.append(self._redact_email(email=value[start:end]))
+            cursor = end
+        parts.append(value[cursor:])
+        return "".join(parts)
+
+    def _iter_email_spans(self, value: str) -> Iterator[tuple[int, int]]:
+        """Yield the spans `email_pattern.finditer` would match, in linear time."""
+        cursor = 0
+        for local_run in self.email_local_run_pattern.finditer(string=value):
+            at_index = local_run.end() - 1
+            boundary = self.word_boundary_pattern.search(value, max(local_run.start(), cursor), at_index)
+            if boundary is None or boundary.start() == at_index:
+                continue
+            domain = self.email_domain_pattern.match(value, at_index + 1)
+            if domain is None:
+                continue
+            yield boundary.start(), domain.end()
+            cursor = domain.end()
 
     def _redact_url_userinfo_in_string(self, value: str) -> str:
         return self.url_userinfo_pattern.sub(
@@ -280,10 +1839,11 @@ class PhiPiiLogRedactor:
             string=value,
         )
 
-    def _redact_url_keyed_value_fragment(self, value: str, value_start: int, value_end: int) -> str:
+    def _redact_url_keyed_value_fragment(self, value: str, value_start: int, value_end: int, *, depth: int = 0) -> str:
         raw = value[value_start:value_end]
         stripped = raw.strip()
-        if not stripped:
+        # URL values are redacted as strings in their own right; cap the nesting so `url=url=...` stays linear.
+        if not stripped or depth >= self.REDACTION_DEPTH:
             return self.REDACTED
         leading = raw[: len(raw) - len(raw.lstrip())]
         trailing = raw[len(raw.rstrip()) :]
@@ -294,21 +1854,36 @@ class PhiPiiLogRedactor:
             has_closing_quote = close > 1 and body[close - 1] == first
             inner_end = close - 1 if has_closing_quote else close
             inner = body[1:inner_end]
-            redacted_inner = self._redact_string(value=inner)
+            redacted_inner = self._redact_string(value=inner, depth=depth + 1)
             closing_quote = body[close - 1] if has_closing_quote else ""
             return f"{leading}{first}{redacted_inner}{closing_quote}{trailing}"
         if first in "{[":
             return self.REDACTED
-        return f"{leading}{self._redact_string(value=body)}{trailing}"
+        return f"{leading}{self._redact_string(value=body, depth=depth + 1)}{trailing}"
 
-    def _get_direct_redacted_value(self, normalized_key: str, value: object) -> tuple[bool, object]:
-        if self._is_email_key(normalized_key=normalized_key):
+    def _record_key_rule(self, classification: KeyClassification) -> None:
+        if self._instrumentation is None:
+            return
+        for key_class, applies in (
+            ("email", classification.is_email),
+            ("phone", classification.is_phone),
+            ("url", classification.is_url),
+            ("sensitive", classification.is_sensitive),
+            ("address", classification.is_address),
+        ):
+            if applies:
+                self._instrumentation.record_key_rule(key_class=key_class)
+                return
+        self._instrumentation.record_key_rule(key_class="result_payload")
+
+    def _get_direct_redacted_value(self, classification: KeyClassification, value: object) -> tuple[bool, object]:
+        if classification.is_email:
             return self._get_email_direct_redacted_value(value=value)
 
-        if self._is_phone_key(normalized_key=normalized_key):
+        if classification.is_phone:
             return True, self.REDACTED if isinstance(value, str) or value else value
 
-        if self._is_url_key(normalized_key=normalized_key):
+        if classification.is_url:
             return self._get_url_direct_redacted_value(value=value)
 
         return False, value
@@ -329,8 +1904,10 @@ class PhiPiiLogRedactor:
         stripped = value.strip()
         if not stripped:
             return False
-        match = self.email_pattern.search(string=stripped)
-        return match is not None and match.start() == 0 and match.end() == len(stripped)
+        if "email" in self._untriggered_string_rules:
+            match = self.email_pattern.search(string=stripped)
+            return match is not None and match.start() == 0 and match.end() == len(stripped)
+        return next(self._iter_email_spans(value=stripped), None) == (0, len(stripped))
 
     @staticmethod
     def _redact_email(email: str) -> str:
@@ -344,25 +1921,58 @@ class PhiPiiLogRedactor:
         return f"...@{domain}"
 
     def _redact_test_result_objects(self, value: str) -> str:
-        return self._redact_balanced_calls(value=value, head_pattern=self.result_object_head_pattern)
+        head_pattern, head_filter = self._get_result_object_heads()
+        return self._redact_balanced_calls(value=value, head_pattern=head_pattern, head_filter=head_filter)
+
+    def _iter_result_object_calls(self, value: str) -> Iterator[tuple[int, int, int]]:
+        head_pattern, head_filter = self._get_result_object_heads()
+        return self._iter_balanced_calls(value=value, head_pattern=head_pattern, head_filter=head_filter)
+
+    def _get_result_object_heads(self) -> tuple[re.Pattern[str], Callable[[re.Match[str]], bool] | None]:
+        if "result_object" in self._untriggered_string_rules:
+            return self.result_object_head_pattern, None
+        return self.result_object_call_pattern, self._is_result_object_call
+
+    def _is_result_object_call(self, match: re.Match[str]) -> bool:
+        name = match.group("name")
+        max_affix = self.RESULT_OBJECT_AFFIX_MAX_LEN
+        return any(
+            1 <= result.start() <= max_affix + 1 and len(name) - result.end() <= max_affix
+            for result in self.result_object_name_pattern.finditer(string=name)
+        )
 
-    def _redact_balanced_calls(self, value: str, head_pattern: re.Pattern[str]) -> str:
+    def _redact_balanced_calls(
+        self,
+        value: str,
+        head_pattern: re.Pattern[str],
+        head_filter: Callable[[re.Match[str]], bool] | None = None,
+    ) -> str:
         parts: list[str] = []
         cursor = 0
+        for start, _, end in self._iter_balanced_calls(value=value, head_pattern=head_pattern, head_filter=head_filter):
+            parts.append(value[cursor:start])
+            parts.append(self.REDACTED)
+            cursor = end
+        parts.append(value[cursor:])
+        return "".join(parts)
+
+    def _iter_balanced_calls(
+        self,
+        value: str,
+        head_pattern: re.Pattern[str],
+        head_filter: Callable[[re.Match[str]], bool] | None = None,
+    ) -> Iterator[tuple[int, int, int]]:
+        """Yield the start, opening parenthesis and end of each call `head_pattern` finds outside earlier calls."""
+        cursor = 0
         for match in head_pattern.finditer(string=value):
-            if match.start() < cursor:
+            if match.start() < cursor or (head_filter is not None and not head_filter(match)):
                 continue
-            parts.append(value[cursor : match.start()])
             open_paren = value.find("(", match.start())
             if open_paren == -1:
-                parts.append(match.group(0))
                 cursor = match.end()
                 continue
-            end = self._find_balanced_call_end(value=value, open_paren_index=open_paren)
-            parts.append(self.REDACTED)
-            cursor = end
-        parts.append(value[cursor:])
-        return "".join(parts)
+            cursor = self._find_balanced_call_end(value=value, open_paren_index=open_paren)
+            yield match.start(), open_paren, cursor
 
     @staticmethod
     def _find_balanced_call_end(value: str, open_paren_index: int) -> int:
@@ -382,34 +1992,39 @@ class PhiPiiLogRedactor:
             cursor += 1
         return len(value)
 
-    def _redact_keyed_values_in_string(self, value: str) -> str:
+    def _redact_keyed_values_in_string(self, value: str, *, depth: int = 0) -> str:
         redacted_parts: list[str] = []
         output_cursor = 0
-        search_cursor = 0
-        while match := self.keyed_value_pattern.search(string=value, pos=search_cursor):
-            key = self._normalize_key(key=match.group("quoted_key") or match.group("plain_key"))
-            if not self._should_redact_string_key(normalized_key=key):
-                search_cursor = match.end()
-                continue
-
-            value_end = self._find_value_end(value=value, value_start=match.end())
+        for match, classification, value_end in self._iter_sensitive_keyed_values(value=value):
             redacted_parts.append(value[output_cursor : match.end()])
-            if self._is_url_key(normalized_key=key):
+            if classification.is_url:
                 redacted_parts.append(
                     self._redact_url_keyed_value_fragment(
                         value=value,
                         value_start=match.end(),
                         value_end=value_end,
+                        depth=depth,
                     ),
                 )
             else:
                 redacted_parts.append(self.REDACTED)
             output_cursor = value_end
-            search_cursor = value_end
 
         redacted_parts.append(value[output_cursor:])
         return "".join(redacted_parts)
 
+    def _iter_sensitive_keyed_values(self, value: str) -> Iterator[tuple[re.Match[str], KeyClassification, int]]:
+        """Yield each `key=` or `"key":` match whose key is sensitive, its classification and its value's end."""
+        search_cursor = 0
+        while match := self.keyed_value_pattern.search(string=value, pos=search_cursor):
+            classification = self._classify_key(key=match.group("quoted_key") or match.group("plain_key"))
+            if not classification.is_string_sensitive:
+                search_cursor = match.end()
+                continue
+            value_end = self._find_value_end(value=value, value_start=match.end())
+            yield match, classification, value_end
+            search_cursor = value_end
+
     def _find_value_end(self, value: str, value_start: int) -> int:
         if value_start >= len(value):
             return value_start
@@ -440,31 +2055,14 @@ class PhiPiiLogRedactor:
 
     @staticmethod
     def _find_quoted_value_end(value: str, value_start: int) -> int:
-        quote = value[value_start]
-        cursor = value_start + 1
-        while cursor < len(value):
-            if value[cursor] == quote and not PhiPiiLogRedactor._is_escaped(value=value, cursor=cursor):
-                return cursor + 1
-            cursor += 1
-        return len(value)
-
-    @staticmethod
-    def _is_escaped(value: str, cursor: int) -> bool:
-        backslash_count = 0
-        index = cursor - 1
-        while index >= 0 and value[index] == "\\":
-            backslash_count += 1
-            index -= 1
-        return backslash_count % 2 == 1
+        pattern = PhiPiiLogRedactor.quoted_value_patterns[value[value_start]]
+        return cast("re.Match[str]", pattern.match(value, value_start)).end()
 
     @staticmethod
     def _find_scalar_value_end(value: str, value_start: int) -> int:
-        cursor = value_start
-        while cursor < len(value) and value[cursor] not in ",}]":
-            cursor += 1
-        return cursor
+        return cast("re.Match[str]", PhiPiiLogRedactor.scalar_value_pattern.match(value, value_start)).end()
 
-    def _redact_exception(self, record: MutableMapping[str, Any]) -> None:
+    def _redact_exception(self, record: MutableMapping[str, Any], budget: RedactionBudget | None = None) -> None:
         exception = record.get("exception")
         exception_value = getattr(exception, "value", None)
         if exception is None or exception_value is None:
@@ -472,29 +2070,292 @@ class PhiPiiLogRedactor:
         if not isinstance(exception, RecordException):
             return
 
-        redacted_message = self._redact_string(value=str(object=exception_value))
-        if redacted_message == str(object=exception_value):
+        redacted_exception = self._redact_exception_chain(exception=exception_value, budget=budget)
+        if redacted_exception is exception_value:
             return
-
-        redacted_exception = self._build_redacted_exception(
-            exception=exception_value,
-            redacted_message=redacted_message,
-        )
         record["exception"] = RecordException(
             type=redacted_exception.__class__,
             value=redacted_exception,
             traceback=exception.traceback,
         )
 
+    def _redact_exception_chain(self, exception: BaseException, budget: RedactionBudget | None) -> BaseException:
+        """Return `exception` with the messages of its displayed chain redacted, or `exception` itself if none change.
+
+        The chain is what a traceback shows: each exception's `__cause__`, else its `__context__` unless suppressed.
+        The originals are never modified: every exception down to the deepest changed one is copied, keeping its
+        traceback and linked to the copy below it.
+        """
+        chain: list[tuple[BaseException, str, str]] = []
+        seen: set[int] = set()
+        current: BaseException | None = exception
+        while current is not None and id(current) not in seen:
+            seen.add(id(current))
+            message = str(object=current)
+            chain.append((
+                current,
+                message,
+                self._redact_exception_message(exception=current, message=message, budget=budget),
+            ))
+            current = current.__cause__ or (None if current.__suppress_context__ else current.__context__)
+
+        changed = [
+            index for index, (_, message, redacted_message) in enumerate(chain) if redacted_message is not message
+        ]
+        if not changed:
+            return exception
+        # The rest of the chain is shared as it is, unless it loops back to an original above: then all of it is
+        # copied, and the copy ends where the loop was.
+        copied = len(chain) if current is not None else changed[-1] + 1
+        below = chain[copied][0] if copied < len(chain) else None
+        for original, message, redacted_message in reversed(chain[:copied]):
+            redacted = (
+                self._copy_exception(exception=original, message=message)
+                if redacted_message is message
+                else self._build_redacted_exception(exception=original, redacted_message=redacted_message)
+            )
+            redacted.__traceback__ = original.__traceback__
+            if original.__cause__ is not None:
+                redacted.__cause__ = below
+            else:
+                redacted.__context__ = below
+                redacted.__suppress_context__ = original.__suppress_context__
+            below = redacted
+        return cast("BaseException", below)
+
+    def _redact_exception_message(self, exception: BaseException, message: str, budget: RedactionBudget | None) -> str:
+        """Return the redacted `message` of `exception`, or `message` itself if it is unchanged."""
+        if budget is not None and not budget.take_string(value=message):
+            return self.REDACTED
+        cache = self._exception_cache
+        if cache is None or len(message) > self.config.exception_cache_max_chars:
+            return self._redact_string(value=message)
+        key = (type(exception), message)
+        redacted = cache.get(key=key)
+        if redacted is None:
+            redacted = self._redact_string(value=message)
+            cache.put(key=key, value=redacted)
+        # Unchanged messages are detected by identity, and a hit returns the string stored for an equal message.
+        return message if redacted == message else redacted
+
     @staticmethod
-    def _build_redacted_exception(exception: Exception, redacted_message: str) -> Exception:
+    def _copy_exception(exception: BaseException, message: str) -> BaseException:
+        """Copy an exception whose message is unchanged, with its arguments, to link it to redacted copies.
+
+        `__init__` is skipped: many exceptions take other arguments than they store in `args` (a status code and a
+        body, say). Exceptions whose message lives in C-level fields instead (`OSError`, `UnicodeError`) do not match
+        their message that way and are copied with `copy.copy`, which goes through `__reduce__`.
+        """
+        cls = type(exception)
+        try:
+            copied = cls.__new__(cls)
+            copied.args = exception.args
+            copied.__dict__.update(exception.__dict__)
+            if str(object=copied) == message:
+                return copied
+            return copy.copy(exception)
+        except Exception:
+            return RuntimeError(message)
+
+    @staticmethod
+    def _build_redacted_exception(exception: BaseException, redacted_message: str) -> BaseException:
         try:
             return exception.__class__(redacted_message)
         except (TypeError, ValueError):
             return RuntimeError(redacted_message)
 
+    def _classify_key(self, key: object) -> KeyClassification:
+        raw = key if isinstance(key, str) else str(object=key)
+        classification = self._safe_key_classifications.get(raw) or self._key_cache.get(raw)
+        if classification is None:
+            classification = self._build_key_classification(normalized_key=self._normalize_key(key=raw))
+            self._key_cache.put(raw, classification)
+        return classification
+
+    def _build_key_classification(self, normalized_key: str) -> KeyClassification:
+        rules = self._match_key_rules(normalized_key=normalized_key)
+        is_sensitive = bool(rules & KEY_RULE_BITS["sensitive"])
+        is_email = bool(rules & KEY_RULE_BITS["email"])
+        is_phone = bool(rules & KEY_RULE_BITS["phone"])
+        is_url = bool(rules & KEY_RULE_BITS["url"])
+        is_address = bool(rules & KEY_RULE_BITS["address"])
+        is_result_container = bool(rules & KEY_RULE_BITS["result_container"])
+        is_result_payload = bool(rules & KEY_RULE_BITS["result_payload"])
+        return KeyClassification(
+            normalized=normalized_key,
+            is_sensitive=is_sensitive,
+            is_email=is_email,
+            is_phone=is_phone,
+            is_url=is_url,
+            is_address=is_address,
+            is_address_container=bool(rules & KEY_RULE_BITS["address_container"]),
+            is_address_child=bool(rules & KEY_RULE_BITS["address_child"]),
+            is_result_container=is_result_container,
+            is_result_payload=is_result_payload,
+            is_loggable_result_payload=bool(rules & KEY_RULE_BITS["loggable_result_payload"]),
+            is_string_sensitive=(
+                is_sensitive
+                or is_address
+                or is_result_container
+                or (is_result_payload and normalized_key != "value")
+                or is_email
+                or is_url
+                or is_phone
+            ),
+            is_plain=not (is_sensitive or is_email or is_phone or is_url or is_address),
+        )
+
+    def _match_key_rules(self, normalized_key: str) -> int:
+        """Return the `KEY_RULE_BITS` of every key rule `normalized_key` satisfies."""
+        if self._key_rule_matcher is None:
+            rules = sum(
+                bit
+                for rule, bit in KEY_RULE_BITS.items()
+                if getattr(self, self.key_rule_methods[rule])(normalized_key=normalized_key)
+            )
+            for configured in self._configured_key_rules:
+                matches = configured.pattern.search if configured.search else configured.pattern.fullmatch
+                if matches(normalized_key) is not None:
+                    rules |= configured.bit
+        else:
+            # Every rule group is optional, so the matcher always matches, if only the empty string.
+            groups = cast("re.Match[str]", self._key_rule_matcher.match(string=normalized_key)).groups()
+            rules = 0
+            for offset, bit in self._key_rule_groups:
+                if groups[offset] is not None:
+                    rules |= bit
+        return 0 if rules & ALLOWED_KEY_BIT else rules
+
+    def _compile_key_rule_matcher(self) -> re.Pattern[str] | None:
+        """Compile every key rule into one pattern, so a key is classified by a single `match()`.
+
+        Each rule is an optional zero-width lookahead from the start of the key (a search for the sensitive rule, a
+        full match for the rest) followed by an empty group named after the rule, so every group a key satisfies is
+        set. The patterns are read from the instance, so subclass overrides are merged in as well; configured key,
+        container and allow rules follow as `configured_<index>` groups. Returns `None` when a subclass overrides a
+        per-rule check or a pattern cannot be embedded; keys are then classified rule by rule.
+        """
+        methods = (*self.key_rule_methods.values(), "_matches_test_result_group")
+        if any(getattr(type(self), method) is not getattr(PhiPiiLogRedactor, method) for method in methods):
+            return None
+        try:
+            lookaheads = {
+                "sensitive": rf"(?=(?s:.*?){self._embed_pattern(self.sensitive_key_pattern, 'sensitive')})",
+                "email": self._full_match_lookahead(self.email_key_pattern, rule="email"),
+                "phone": self._full_match_lookahead(self.phone_key_pattern, rule="phone"),
+                "url": self._full_match_lookahead(self.url_key_pattern, rule="url"),
+                "address": self._full_match_lookahead(*self.address_key_patterns, rule="address"),
+                "address_container": self._full_match_lookahead(
+                    self.address_container_key_pattern,
+                    rule="address_container",
+                ),
+                "address_child": self._full_match_lookahead(self.address_child_key_pattern, rule="address_child"),
+                "loggable_result_payload": self._full_match_lookahead(
+                    self.loggable_result_payload_key_pattern,
+                    rule="loggable_result_payload",
+                ),
+            }
+            # The result pattern's own `container` and `payload` groups become the `result_*` rule groups.
+            result_lookahead = self._full_match_lookahead(self.test_result_pattern, rule="result")
+            for index, configured in enumerate(self._configured_key_rules):
+                rule = f"configured_{index}"
+                lookaheads[rule] = (
+                    rf"(?=(?s:.*?){self._embed_pattern(configured.pattern, rule)})"
+                    if configured.search
+                    else self._full_match_lookahead(configured.pattern, rule=rule)
+                )
+            return re.compile(
+                pattern="".join(f"(?:{lookahead}(?P<{rule}>))?" for rule, lookahead in lookaheads.items())
+                + f"(?:{result_lookahead})?",
+            )
+        except (re.error, ValueError):
+            return None
+
+    @staticmethod
+    def _compile_configured_key_rules(rules: RedactionRules) -> tuple[ConfiguredKeyRule, ...]:
+        """Compile the configured key, container and allow rules, in that order, against normalized keys."""
+        configured = [
+            ConfiguredKeyRule(
+                pattern=re.compile(pattern=rule.pattern, flags=re.IGNORECASE),
+                search=rule.match == "search",
+                bit=KEY_RULE_BITS[rule.category],
+            )
+            for rule in rules.key_rules
+        ]
+        configured.extend(
+            ConfiguredKeyRule(
+                pattern=re.compile(pattern=rule.pattern, flags=re.IGNORECASE),
+                search=False,
+                bit=KEY_RULE_BITS[f"{rule.kind}_container"],
+            )
+            for rule in rules.container_rules
+        )
+        configured.extend(
+            ConfiguredKeyRule(
+                pattern=re.compile(pattern=rule.pattern, flags=re.IGNORECASE),
+                search=False,
+                bit=ALLOWED_KEY_BIT,
+            )
+            for rule in rules.allow_rules
+        )
+        return tuple(configured)
+
+    def _compile_value_rules(
+        self,
+        rules: RedactionRules,
+    ) -> tuple[re.Pattern[str] | None, tuple[tuple[re.Pattern[str], str], ...]]:
+        """Compile the configured value rules into one alternation, so a string is scanned for all of them at once.
+
+        Returns the alternation (`None` without value rules) and each rule's own pattern and replacement. The
+        alternation has no group per rule because capturing groups stop `re` from skipping ahead to a literal
+        prefix; the rule behind a match is looked up only when there is one.
+        """
+        compiled = tuple(
+            (
+                re.compile(pattern=rule.pattern, flags=re.IGNORECASE if rule.ignore_case else 0),
+                self.REDACTED if rule.replacement is None else rule.replacement,
+            )
+            for rule in rules.value_rules
+        )
+        if not compiled:
+            return None, ()
+        alternation = "|".join(
+            self._embed_pattern(pattern, f"value_{index}") for index, (pattern, _) in enumerate(compiled)
+        )
+        return re.compile(pattern=alternation), compiled
+
+    def _full_match_lookahead(self, *patterns: re.Pattern[str], rule: str) -> str:
+        alternatives = "|".join(self._embed_pattern(pattern, rule) for pattern in patterns)
+        return rf"(?=(?:{alternatives})\Z)"
+
+    def _embed_pattern(self, pattern: re.Pattern[str], rule: str) -> str:
+        """Return `pattern` as a group with its own flags and its named groups prefixed with `rule`."""
+        if self.numbered_backreference_pattern.search(string=pattern.pattern):
+            msg = f"numbered backreferences cannot be embedded: {pattern.pattern!r}"
+            raise ValueError(msg)
+        source = self.group_name_pattern.sub(
+            repl=lambda match: f"(?P<{rule}_{match.group(1)}>" if match.group(1) else f"(?P={rule}_{match.group(2)})",
+            string=pattern.pattern,
+        )
+        flags = "".join(letter for flag, letter in SCOPED_PATTERN_FLAGS if pattern.flags & flag)
+        # A verbose pattern may end in a comment, which would swallow the closing parenthesis.
+        return f"(?{flags}:{source}\n)" if "x" in flags else f"(?{flags}:{source})"
+
     def _normalize_key(self, key: object) -> str:
         raw = str(object=key)
+        if not raw.isascii():
+            # Unicode case rules (`É` is uppercase but still a separator) are only followed character by character.
+            return self._normalize_key_by_char(raw=raw)
+        normalized = raw
+        # Without lowercase letters an ASCII key is constant-style (see `_should_split_mixed_case`); without
+        # uppercase letters it has no mixed-case boundary.
+        if not raw.isupper() and not raw.islower():
+            normalized = self.mixed_case_boundary_pattern.sub(repl="_", string=normalized)
+        if not normalized.isalnum():
+            normalized = self.key_separator_run_pattern.sub(repl="_", string=normalized).strip("_")
+        return normalized.lower()
+
+    def _normalize_key_by_char(self, raw: str) -> str:
         split_mixed_case = self._should_split_mixed_case(raw=raw)
         normalized: list[str] = []
         for index, char in enumerate(raw):
@@ -595,28 +2456,9 @@ class PhiPiiLogRedactor:
         match = self.test_result_pattern.fullmatch(string=value)
         return match is not None and match.group(group_name) is not None
 
-    def _should_redact_key(self, normalized_key: str, *, in_result_payload: bool) -> bool:
-        return (
-            self._is_sensitive_key(normalized_key=normalized_key)
-            or self._is_address_key(normalized_key=normalized_key)
-            or (in_result_payload and self._is_test_result_payload_key(normalized_key=normalized_key))
-        )
-
-    def _should_redact_string_key(self, normalized_key: str) -> bool:
-        return (
-            self._should_redact_key(normalized_key=normalized_key, in_result_payload=False)
-            or self._is_test_result_container_key(normalized_key=normalized_key)
-            or self._is_specific_test_result_field(normalized_key=normalized_key)
-            or self._is_email_key(normalized_key=normalized_key)
-            or self._is_url_key(normalized_key=normalized_key)
-            or self._is_phone_key(normalized_key=normalized_key)
-        )
-
-    def _looks_like_result_payload(self, keys: set[str]) -> bool:
-        return (
-            any(self._is_test_result_payload_key(normalized_key=key) and key != "value" for key in keys)
-            and "value" in keys
-        )
-
-    def _is_specific_test_result_field(self, normalized_key: str) -> bool:
-        return self._is_test_result_payload_key(normalized_key=normalized_key) and normalized_key != "value"
+    @staticmethod
+    def _looks_like_result_payload(classifications: list[KeyClassification]) -> bool:
+        return any(
+            classification.is_result_payload and classification.normalized != "value"
+            for classification in classifications
+        ) and any(classification.normalized == "value" for classification in classifications)
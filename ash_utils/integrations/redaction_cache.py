@@ -0,0 +1,224 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+DEFAULT_CACHE_SHARDS = 16
+# A cache too small to give each shard this many entries gets fewer shards, down to one with exact eviction order.
+MIN_ENTRIES_PER_SHARD = 64
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Point-in-time counters of a bounded redaction cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class BoundedLRUCache(Generic[K, V]):
+    """Thread-safe least-recently-used mapping with a fixed capacity.
+
+    A ``maxsize`` of ``0`` disables caching: every lookup is a miss and nothing is stored.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 0:
+            msg = f"maxsize must be >= 0, got {maxsize}"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value  # type: ignore[return-value]
+
+    def put(self, key: K, value: V) -> None:
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class BoundedClockCache(Generic[K, V]):
+    """Thread-safe mapping with a fixed capacity and CLOCK (second-chance) eviction.
+
+    A hit only sets the entry's reference bit instead of reordering entries as LRU does, so lookups that mostly
+    hit stay cheap. When full, the clock hand sweeps the slots, clearing reference bits, and replaces the first
+    entry not referenced since the last sweep. A ``maxsize`` of ``0`` disables caching.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 0:
+            msg = f"maxsize must be >= 0, got {maxsize}"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self._slots: dict[K, int] = {}
+        self._keys: list[K] = []
+        self._values: list[V] = []
+        self._referenced = bytearray(maxsize)
+        self._hand = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                self._misses += 1
+                return None
+            self._referenced[slot] = 1
+            self._hits += 1
+            return self._values[slot]
+
+    def put(self, key: K, value: V) -> None:
+        if not self.maxsize:
+            return
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None and len(self._keys) < self.maxsize:
+                slot = len(self._keys)
+                self._keys.append(key)
+                self._values.append(value)
+                self._slots[key] = slot
+                return
+            if slot is None:
+                slot = self._advance_hand()
+                del self._slots[self._keys[slot]]
+                self._evictions += 1
+                self._keys[slot] = key
+                self._slots[key] = slot
+            self._values[slot] = value
+
+    def _advance_hand(self) -> int:
+        """Return the first slot past the hand whose entry was not referenced, clearing reference bits on the way."""
+        referenced = self._referenced
+        while referenced[self._hand]:
+            referenced[self._hand] = 0
+            self._hand = (self._hand + 1) % self.maxsize
+        slot = self._hand
+        self._hand = (slot + 1) % self.maxsize
+        return slot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._slots.clear()
+            self._keys.clear()
+            self._values.clear()
+            self._referenced = bytearray(self.maxsize)
+            self._hand = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._slots),
+                maxsize=self.maxsize,
+            )
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+
+class ShardedCache(Generic[K, V]):
+    """Bounded mapping split by key hash into independently locked `BoundedLRUCache` or `BoundedClockCache` shards.
+
+    Threads looking up different keys rarely contend for the same lock, which keeps a redactor shared by a thread
+    pool (or running on a free-threaded build) from serializing on its caches. `maxsize` is divided between the
+    shards and each evicts on its own, so eviction order only holds within a shard.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        *,
+        cache_factory: Callable[[int], BoundedLRUCache[K, V] | BoundedClockCache[K, V]] = BoundedLRUCache,
+        shards: int = DEFAULT_CACHE_SHARDS,
+    ) -> None:
+        if maxsize < 0:
+            msg = f"maxsize must be >= 0, got {maxsize}"
+            raise ValueError(msg)
+        if shards < 1:
+            msg = f"shards must be at least 1, got {shards}"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        count = max(1, min(shards, maxsize // MIN_ENTRIES_PER_SHARD))
+        size, larger = divmod(maxsize, count)
+        self._shards = tuple(cache_factory(size + (index < larger)) for index in range(count))
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._shards)
+
+    def get(self, key: K) -> V | None:
+        return self._shards[hash(key) % len(self._shards)].get(key)
+
+    def put(self, key: K, value: V) -> None:
+        self._shards[hash(key) % len(self._shards)].put(key, value)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    def stats(self) -> CacheStats:
+        """Counters summed over the shards, each read under its own lock rather than all at one instant."""
+        shard_stats = [shard.stats() for shard in self._shards]
+        return CacheStats(
+            hits=sum(stats.hits for stats in shard_stats),
+            misses=sum(stats.misses for stats in shard_stats),
+            evictions=sum(stats.evictions for stats in shard_stats),
+            size=sum(stats.size for stats in shard_stats),
+            maxsize=self.maxsize,
+        )
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
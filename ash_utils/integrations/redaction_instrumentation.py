@@ -0,0 +1,148 @@
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class RuleStats:
+    """Work done by one redaction rule family; `hits` counts the strings the rule changed."""
+
+    runs: int
+    hits: int
+    seconds: float
+    chars_scanned: int
+
+
+@dataclass(frozen=True, slots=True)
+class RedactionStats:
+    """Point-in-time counters of an instrumented `PhiPiiLogRedactor`.
+
+    `string_rules` covers the string rule families; time spent in nested values a rule redacts (such as a `url=`
+    value inside a keyed value) is counted by both the outer and the inner rule. `key_rules` counts values redacted
+    or masked because of their key, by key class. `redaction_errors` counts records replaced by `REDACTION_ERROR`.
+    """
+
+    string_rules: dict[str, RuleStats]
+    key_rules: dict[str, int]
+    redaction_errors: int
+
+
+class PerThreadCells(Generic[T]):
+    """One mutable counter cell per thread, updated without a lock; readers merge `cells()`.
+
+    Each thread only ever writes its own cell, so threads counting at once never wait on each other, even on a
+    free-threaded build. A reader may miss increments still in progress on other threads. A thread that starts
+    after another exited takes over the exited thread's cell and keeps adding to it, so the number of cells stays
+    at the number of threads running at once and no counts are lost.
+    """
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self._factory = factory
+        self._local = threading.local()
+        # Taken to hand out a cell (once per thread) and to list the cells, never to count.
+        self._lock = threading.Lock()
+        self._owners: list[threading.Thread] = []
+        self._cells: list[T] = []
+
+    def get(self) -> T:
+        """Return the calling thread's cell."""
+        try:
+            return self._local.cell
+        except AttributeError:
+            return self._claim()
+
+    def cells(self) -> list[T]:
+        with self._lock:
+            return list(self._cells)
+
+    def _claim(self) -> T:
+        thread = threading.current_thread()
+        with self._lock:
+            for index, owner in enumerate(self._owners):
+                if not owner.is_alive():
+                    self._owners[index] = thread
+                    cell = self._cells[index]
+                    break
+            else:
+                cell = self._factory()
+                self._owners.append(thread)
+                self._cells.append(cell)
+        self._local.cell = cell
+        return cell
+
+
+@dataclass(slots=True)
+class _RuleCounters:
+    runs: int = 0
+    hits: int = 0
+    seconds: float = 0.0
+    chars_scanned: int = 0
+
+
+@dataclass(slots=True)
+class _InstrumentationCell:
+    rules: dict[str, _RuleCounters] = field(default_factory=dict)
+    key_rules: dict[str, int] = field(default_factory=dict)
+    redaction_errors: int = 0
+
+
+class RedactionInstrumentation:
+    """Thread-safe accumulator behind `PhiPiiLogRedactor.redaction_stats`, counted per thread (see `PerThreadCells`)."""
+
+    def __init__(self) -> None:
+        self._cells = PerThreadCells(factory=_InstrumentationCell)
+
+    def record_rule(self, rule: str, *, changed: bool, seconds: float, chars_scanned: int) -> None:
+        rules = self._cells.get().rules
+        counters = rules.get(rule)
+        if counters is None:
+            counters = rules[rule] = _RuleCounters()
+        counters.runs += 1
+        counters.hits += changed
+        counters.seconds += seconds
+        counters.chars_scanned += chars_scanned
+
+    def record_key_rule(self, key_class: str) -> None:
+        key_rules = self._cells.get().key_rules
+        key_rules[key_class] = key_rules.get(key_class, 0) + 1
+
+    def record_redaction_error(self) -> None:
+        self._cells.get().redaction_errors += 1
+
+    def snapshot(self) -> RedactionStats:
+        rules: dict[str, _RuleCounters] = {}
+        key_rules: dict[str, int] = {}
+        redaction_errors = 0
+        for cell in self._cells.cells():
+            for rule, counters in list(cell.rules.items()):
+                total = rules.setdefault(rule, _RuleCounters())
+                total.runs += counters.runs
+                total.hits += counters.hits
+                total.seconds += counters.seconds
+                total.chars_scanned += counters.chars_scanned
+            for key_class, count in list(cell.key_rules.items()):
+                key_rules[key_class] = key_rules.get(key_class, 0) + count
+            redaction_errors += cell.redaction_errors
+        return RedactionStats(
+            string_rules={
+                rule: RuleStats(
+                    runs=counters.runs,
+                    hits=counters.hits,
+                    seconds=counters.seconds,
+                    chars_scanned=counters.chars_scanned,
+                )
+                for rule, counters in rules.items()
+            },
+            key_rules=key_rules,
+            redaction_errors=redaction_errors,
+        )
+
+    def reset(self) -> None:
+        """Zero the counters; increments made by other threads while resetting may survive it."""
+        for cell in self._cells.cells():
+            cell.rules.clear()
+            cell.key_rules.clear()
+            cell.redaction_errors = 0
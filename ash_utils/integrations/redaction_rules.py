@@ -0,0 +1,271 @@
+import re
+import sys
+from dataclasses import dataclass
+from typing import Any, Literal, get_args
+
+# The parser behind `re.compile` has no public API, and typeshed only stubs the deprecated pre-3.11 module names, so
+# its parse tree is read as `Any`.
+if sys.version_info >= (3, 11):  # noqa: UP036
+    from re import _constants as sre_constants  # pyright: ignore[reportAttributeAccessIssue]
+    from re import _parser as sre_parser  # pyright: ignore[reportAttributeAccessIssue]
+else:
+    import sre_constants
+    import sre_parse as sre_parser
+
+KeyCategory = Literal[
+    "sensitive",
+    "email",
+    "phone",
+    "url",
+    "address",
+    "address_child",
+    "result_payload",
+    "loggable_result_payload",
+]
+ContainerKind = Literal["address", "result"]
+KeyMatch = Literal["full", "search"]
+
+# Embedded patterns are renumbered, so numbered backreferences are rejected up front instead of surfacing as wrong
+# matches. So are the shapes that backtrack exponentially (see `_find_exponential_repeat`); patterns can still be
+# polynomial, such as `\w+\w+!`, so rules should stay anchored on literal text where they can.
+NUMBERED_BACKREFERENCE_PATTERN = re.compile(pattern=r"\\[1-9]")
+# Characters the first-character overlap check tries; wider alphabets only widen classes that already overlap.
+FIRST_CHAR_SAMPLE = range(256)
+CATEGORY_CHECKS = {
+    sre_constants.CATEGORY_DIGIT: str.isdigit,
+    sre_constants.CATEGORY_NOT_DIGIT: lambda char: not char.isdigit(),
+    sre_constants.CATEGORY_SPACE: str.isspace,
+    sre_constants.CATEGORY_NOT_SPACE: lambda char: not char.isspace(),
+    sre_constants.CATEGORY_WORD: lambda char: char.isalnum() or char == "_",
+    sre_constants.CATEGORY_NOT_WORD: lambda char: not (char.isalnum() or char == "_"),
+}
+VARIABLE_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+
+
+class RedactionRuleError(ValueError):
+    """Raised when a redaction rule cannot be compiled into `PhiPiiLogRedactor`'s matchers."""
+
+    def __init__(self, rule: str, message: str) -> None:
+        self.rule = rule
+        self.message = message
+        super().__init__(f"Redaction rule '{rule}' is invalid: {message}")
+
+
+@dataclass(frozen=True, slots=True)
+class KeyRule:
+    """Values under keys matching `pattern` are redacted like the built-in `category` keys.
+
+    Patterns run against normalized snake_case keys (`patientMRN` becomes `patient_mrn`), ignoring case; `match`
+    chooses between a full match of the key and a search anywhere in it.
+    """
+
+    name: str
+    pattern: str
+    category: KeyCategory = "sensitive"
+    match: KeyMatch = "full"
+
+
+@dataclass(frozen=True, slots=True)
+class ValueRule:
+    """Text matching `pattern` anywhere in a logged string is replaced by `replacement`, `REDACTED` by default."""
+
+    name: str
+    pattern: str
+    replacement: str | None = None
+    ignore_case: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class ContainerRule:
+    """Mappings under keys fully matching `pattern` get the `kind` container handling.
+
+    Address containers redact their street and line children; result containers redact their children as result
+    payloads.
+    """
+
+    name: str
+    pattern: str
+    kind: ContainerKind
+
+
+@dataclass(frozen=True, slots=True)
+class AllowRule:
+    """Keys fully matching `pattern` are exempt from every key rule; their values still get the string rules."""
+
+    name: str
+    pattern: str
+
+
+@dataclass(frozen=True, slots=True)
+class RedactionRules:
+    """Service-specific rules `PhiPiiLogRedactor` compiles into its matchers once, at construction.
+
+    Every rule is validated here, so a bad pattern fails at startup with a `RedactionRuleError` naming the rule.
+    """
+
+    key_rules: tuple[KeyRule, ...] = ()
+    value_rules: tuple[ValueRule, ...] = ()
+    container_rules: tuple[ContainerRule, ...] = ()
+    allow_rules: tuple[AllowRule, ...] = ()
+
+    def __post_init__(self) -> None:
+        names: set[str] = set()
+        for rule in (*self.key_rules, *self.value_rules, *self.container_rules, *self.allow_rules):
+            if not rule.name or rule.name in names:
+                raise RedactionRuleError(rule=rule.name, message="rule names must be unique and non-empty")
+            names.add(rule.name)
+            _validate_pattern(rule=rule.name, pattern=rule.pattern)
+        for key_rule in self.key_rules:
+            _validate_choice(rule=key_rule.name, field="category", value=key_rule.category, choices=KeyCategory)
+            _validate_choice(rule=key_rule.name, field="match", value=key_rule.match, choices=KeyMatch)
+        for container_rule in self.container_rules:
+            _validate_choice(rule=container_rule.name, field="kind", value=container_rule.kind, choices=ContainerKind)
+
+
+def _validate_pattern(rule: str, pattern: str) -> None:
+    try:
+        compiled = re.compile(pattern=pattern)
+    except re.error as error:
+        raise RedactionRuleError(rule=rule, message=f"pattern does not compile: {error}") from error
+    if compiled.search(string="") is not None:
+        raise RedactionRuleError(rule=rule, message="pattern matches the empty string")
+    if NUMBERED_BACKREFERENCE_PATTERN.search(string=pattern):
+        raise RedactionRuleError(rule=rule, message="numbered backreferences are not supported; use (?P=name)")
+    problem = _find_exponential_repeat(items=sre_parser.parse(str=pattern))
+    if problem is not None:
+        raise RedactionRuleError(
+            rule=rule,
+            message=f"{problem} can backtrack exponentially; make the inner part possessive (a++) or atomic (?>...)",
+        )
+
+
+def _find_exponential_repeat(items: Any) -> str | None:  # noqa: ANN401
+    """Describe the first repeated group that can match the same text in exponentially many ways, if any.
+
+    That is a group repeated more than once that holds a variable quantifier (`(\\w+\\s?)+`) or alternatives that
+    can start with the same character (`(?:a|aa)+`). Possessive repeats and atomic groups never backtrack into
+    their body, so neither their contents nor their own repetition is checked.
+    """
+    for op, argument in items:
+        if op in VARIABLE_REPEATS:
+            _, maximum, body = argument
+            if maximum > 1:
+                if _contains_variable_repeat(items=body):
+                    return "nested quantifiers"
+                if _contains_overlapping_branch(items=body):
+                    return "overlapping alternatives under a quantifier"
+            nested = _find_exponential_repeat(items=body)
+        else:
+            nested = next(
+                (
+                    found
+                    for child in _child_patterns(op=op, argument=argument)
+                    if (found := _find_exponential_repeat(child))
+                ),
+                None,
+            )
+        if nested is not None:
+            return nested
+    return None
+
+
+def _child_patterns(op: object, argument: Any) -> list[Any]:  # noqa: ANN401
+    """The sub-patterns directly inside one parsed item, other than a repeat body."""
+    if op is sre_constants.SUBPATTERN:
+        return [argument[3]]
+    if op is sre_constants.BRANCH:
+        return list(argument[1])
+    if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT, sre_constants.ATOMIC_GROUP):
+        return [argument[1] if op is not sre_constants.ATOMIC_GROUP else argument]
+    if op is sre_constants.POSSESSIVE_REPEAT:
+        return [argument[2]]
+    if op is sre_constants.GROUPREF_EXISTS:
+        return [branch for branch in argument[1:] if branch is not None]
+    return []
+
+
+def _contains_variable_repeat(items: Any) -> bool:  # noqa: ANN401
+    for op, argument in items:
+        if op in VARIABLE_REPEATS and argument[0] != argument[1]:
+            return True
+        body = [argument[2]] if op in VARIABLE_REPEATS else []
+        if op not in (sre_constants.ATOMIC_GROUP, sre_constants.POSSESSIVE_REPEAT) and any(
+            _contains_variable_repeat(items=child) for child in [*body, *_child_patterns(op=op, argument=argument)]
+        ):
+            return True
+    return False
+
+
+def _contains_overlapping_branch(items: Any) -> bool:  # noqa: ANN401
+    for op, argument in items:
+        if op is sre_constants.BRANCH:
+            first_chars = _branch_first_chars(branches=argument[1])
+            if first_chars is None:
+                return True
+            seen: set[int] = set()
+            for chars in first_chars:
+                if seen & chars:
+                    return True
+                seen |= chars
+        body = [argument[2]] if op in VARIABLE_REPEATS else []
+        if op not in (sre_constants.ATOMIC_GROUP, sre_constants.POSSESSIVE_REPEAT) and any(
+            _contains_overlapping_branch(items=child) for child in [*body, *_child_patterns(op=op, argument=argument)]
+        ):
+            return True
+    return False
+
+
+def _first_chars(items: Any) -> frozenset[int] | None:  # noqa: ANN401, PLR0911
+    """The sample characters a match of `items` can start with, either case; `None` if unknown or possibly empty."""
+    if not items:
+        return None
+    op, argument = items[0]
+    if op is sre_constants.LITERAL:
+        char = chr(argument)
+        return frozenset(ord(variant) for variant in (char, char.lower(), char.upper()) if len(variant) == 1)
+    if op is sre_constants.IN:
+        return frozenset(code for code in FIRST_CHAR_SAMPLE if _in_class(char=chr(code), members=argument))
+    if op in (sre_constants.ANY, sre_constants.NOT_LITERAL):
+        return frozenset(FIRST_CHAR_SAMPLE)
+    if op is sre_constants.SUBPATTERN:
+        return _first_chars(items=argument[3])
+    if op in (*VARIABLE_REPEATS, sre_constants.POSSESSIVE_REPEAT) and argument[0] > 0:
+        return _first_chars(items=argument[2])
+    if op is sre_constants.BRANCH:
+        branches = _branch_first_chars(branches=argument[1])
+        return None if branches is None else frozenset[int]().union(*branches)
+    return None
+
+
+def _branch_first_chars(branches: list[Any]) -> list[frozenset[int]] | None:
+    """`_first_chars` of every branch of an alternation; `None` if any branch's is unknown."""
+    first_chars: list[frozenset[int]] = []
+    for branch in branches:
+        chars = _first_chars(items=branch)
+        if chars is None:
+            return None
+        first_chars.append(chars)
+    return first_chars
+
+
+def _in_class(char: str, members: list[Any]) -> bool:
+    matched = False
+    for op, argument in members:
+        if op is sre_constants.NEGATE:
+            continue
+        if op is sre_constants.LITERAL:
+            matched = ord(char.lower()) == argument or ord(char.upper()) == argument or ord(char) == argument
+        elif op is sre_constants.RANGE:
+            matched = any(argument[0] <= ord(variant) <= argument[1] for variant in (char, char.lower(), char.upper()))
+        elif op is sre_constants.CATEGORY:
+            matched = CATEGORY_CHECKS.get(argument, lambda _char: True)(char)
+        if matched:
+            break
+    negated = bool(members) and members[0][0] is sre_constants.NEGATE
+    return matched != negated
+
+
+def _validate_choice(rule: str, field: str, value: str, choices: object) -> None:
+    allowed = get_args(choices)
+    if value not in allowed:
+        raise RedactionRuleError(rule=rule, message=f"{field} must be one of {', '.join(allowed)}, got {value!r}")
@@ -0,0 +1,80 @@
+"""Adversarial-input benchmark for the `PhiPiiLogRedactor` string rules.
+
+Each case builds a pathological message (long identifier runs, dense `@` signs, escaped quotes, nested
+`url=` values, ...) at several sizes and reports the redaction cost per input byte. A linear engine keeps
+that cost flat as the message grows; a ratio well above 1 between the largest and smallest size points at a
+super-linear rule.
+
+Run from the repository root:
+
+    python -m benchmarks.adversarial
+    python -m benchmarks.adversarial --sizes 65536 1048576 --cases email_local_dots nested_url_keys
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+
+from ash_utils.integrations import PhiPiiLogRedactor
+
+DEFAULT_SIZES = (65_536, 262_144, 1_048_576)
+
+
+def _repeat(fragment: str, size: int, suffix: str = "") -> str:
+    return fragment * (size // len(fragment)) + suffix
+
+
+CASES: dict[str, Callable[[int], str]] = {
+    "identifier": lambda size: _repeat("a", size),
+    "result_words": lambda size: _repeat("result" * 600 + " ", size),
+    "result_call_words": lambda size: _repeat("x" + "result" * 400 + "q" * 3000 + "(", size),
+    "email_local_dots": lambda size: _repeat(".a", size, suffix="@"),
+    "email_domain": lambda size: "a@" + _repeat("a.", size),
+    "at_signs": lambda size: _repeat("a@", size),
+    "escaped_quotes": lambda size: "token='" + _repeat("\\'", size),
+    "backslash_runs": lambda size: "LabResult('" + _repeat("\\" * 64 + "'", size),
+    "nested_url_keys": lambda size: _repeat("url=", size),
+    "plain_keys": lambda size: _repeat("a=", size),
+    "digit_run_key": lambda size: _repeat("1", size, suffix="="),
+    "quoted_keys": lambda size: _repeat("'a':", size),
+    "secret_keys": lambda size: _repeat("token=", size),
+    "bearer_tokens": lambda size: _repeat("bearer ", size),
+    "open_calls": lambda size: _repeat("LabResult(", size),
+    "url_schemes": lambda size: _repeat("http://a", size),
+    "long_key": lambda size: _repeat("a_", size, suffix="=1"),
+}
+
+
+def measure(redactor: PhiPiiLogRedactor, message: str, repeat: int) -> float:
+    """Return the best-of-`repeat` redaction time of `message`, in nanoseconds per byte."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        redactor._redact_string(value=message)  # noqa: SLF001
+        best = min(best, time.perf_counter() - started)
+    return best / len(message) * 1e9
+
+
+def run(cases: list[str], sizes: list[int], repeat: int) -> int:
+    redactor = PhiPiiLogRedactor()
+    header = "".join(f"{size:>14,}" for size in sizes)
+    sys.stdout.write(f"{'case':<20}{header}{'max/min':>10}\n")
+    for name in cases:
+        costs = [measure(redactor=redactor, message=CASES[name](size), repeat=repeat) for size in sizes]
+        row = "".join(f"{cost:>10.1f}ns/B" for cost in costs)
+        sys.stdout.write(f"{name:<20}{row}{max(costs) / min(costs):>10.2f}\n")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="message sizes in bytes")
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES), help="cases to run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case and size; the fastest is reported")
+    args = parser.parse_args(argv)
+    return run(cases=args.cases, sizes=args.sizes, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,216 @@
+"""Multi-thread and multi-process scaling benchmark for `PhiPiiLogRedactor.redact_record`.
+
+Each of N workers redacts the same seeded corpus (see `benchmarks.corpus`) for a few rounds, all starting
+together, and the report gives the aggregate records/sec at each N, the speedup over one worker and the parallel
+efficiency (speedup / N). The modes:
+
+- `threads`: N threads share one redactor, like a thread pool of log handlers. Its caches and counters are
+  shared state, so this is the curve to watch for lock contention.
+- `threads-private`: N threads with a redactor each. Shared-state contention is the gap between this curve and
+  `threads`.
+- `processes`: N processes with a redactor each, the ceiling for the hardware.
+
+On a GIL build both thread modes stay near 1x. On a free-threaded build (e.g. 3.13t) they should follow
+`processes` up to the number of cores.
+
+Run from the repository root:
+
+    python -m benchmarks.concurrency
+    python -m benchmarks.concurrency --modes threads processes --workers 1 2 4 8 16 --output scaling.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from ash_utils.integrations import PhiPiiLogRedactor
+
+from benchmarks.corpus import CATEGORIES, Record, generate_corpus
+
+DEFAULT_SEED = 20_240_601
+DEFAULT_WORKERS = (1, 2, 4, 8)
+MODES = ("threads", "threads-private", "processes")
+# Seconds a worker waits for the others to be ready before the timed run gives up.
+START_TIMEOUT = 120.0
+
+# The corpus and rounds of one benchmark process, set by `_init_process`.
+_process_state: dict[str, Any] = {}
+
+
+def _redact(redactor: PhiPiiLogRedactor, sample: Record) -> None:
+    # `redact_record` replaces `message` and `extra` in place, so each run gets a fresh record around the sample.
+    redactor.redact_record(record={"message": sample["message"], "extra": sample["extra"]})
+
+
+def redact_rounds(
+    redactor: PhiPiiLogRedactor,
+    records: list[Record],
+    rounds: int,
+    start: threading.Barrier,
+) -> tuple[float, float]:
+    """Warm up, wait for the other workers, then redact `records` `rounds` times; return the start and end times."""
+    for sample in records:
+        _redact(redactor=redactor, sample=sample)
+    start.wait(timeout=START_TIMEOUT)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for sample in records:
+            _redact(redactor=redactor, sample=sample)
+    return started, time.perf_counter()
+
+
+def _init_process(start: threading.Barrier, seed: int, records: int, categories: list[str], rounds: int) -> None:
+    corpus = generate_corpus(seed=seed, records=records, categories=categories)
+    _process_state.update(
+        start=start,
+        records=[sample for samples in corpus.values() for sample in samples],
+        rounds=rounds,
+    )
+
+
+def _redact_in_process() -> tuple[float, float]:
+    return redact_rounds(
+        redactor=PhiPiiLogRedactor(),
+        records=_process_state["records"],
+        rounds=_process_state["rounds"],
+        start=_process_state["start"],
+    )
+
+
+def run_threads(records: list[Record], rounds: int, workers: int, *, shared: bool) -> list[tuple[float, float]]:
+    start = threading.Barrier(parties=workers)
+    shared_redactor = PhiPiiLogRedactor()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                redact_rounds,
+                redactor=shared_redactor if shared else PhiPiiLogRedactor(),
+                records=records,
+                rounds=rounds,
+                start=start,
+            )
+            for _ in range(workers)
+        ]
+        return [future.result() for future in futures]
+
+
+def run_processes(
+    seed: int,
+    records: int,
+    categories: list[str],
+    rounds: int,
+    workers: int,
+) -> list[tuple[float, float]]:
+    # `perf_counter` is the system-wide monotonic clock on Linux and macOS, so times compare across processes.
+    start = multiprocessing.Barrier(parties=workers)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_process,
+        initargs=(start, seed, records, categories, rounds),
+    ) as executor:
+        futures = [executor.submit(_redact_in_process) for _ in range(workers)]
+        return [future.result() for future in futures]
+
+
+def records_per_sec(spans: list[tuple[float, float]], records_per_worker: int) -> float:
+    """Aggregate throughput from the first worker starting to the last one finishing."""
+    elapsed = max(end for _, end in spans) - min(started for started, _ in spans)
+    return records_per_worker * len(spans) / elapsed
+
+
+def _gil_enabled() -> bool:
+    # `sys._is_gil_enabled` exists from 3.13; older interpreters always have the GIL.
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _write_table(results: dict[str, list[dict[str, float]]]) -> None:
+    sys.stdout.write(f"{'mode':<18}{'workers':>8}{'records/s':>14}{'speedup':>10}{'efficiency':>12}\n")
+    for mode, points in results.items():
+        for point in points:
+            sys.stdout.write(
+                f"{mode:<18}{point['workers']:>8.0f}{point['records_per_sec']:>14,.1f}"
+                f"{point['speedup']:>9.2f}x{point['efficiency']:>11.0%}\n"
+            )
+
+
+def run(
+    modes: list[str],
+    workers: list[int],
+    categories: list[str],
+    seed: int,
+    records: int,
+    rounds: int,
+    output: Path | None,
+) -> int:
+    corpus = generate_corpus(seed=seed, records=records, categories=categories)
+    samples = [sample for category in corpus.values() for sample in category]
+    records_per_worker = len(samples) * rounds
+    results: dict[str, list[dict[str, float]]] = {}
+    for mode in modes:
+        points = results[mode] = []
+        for count in workers:
+            if mode == "processes":
+                spans = run_processes(seed=seed, records=records, categories=categories, rounds=rounds, workers=count)
+            else:
+                spans = run_threads(records=samples, rounds=rounds, workers=count, shared=mode == "threads")
+            throughput = records_per_sec(spans=spans, records_per_worker=records_per_worker)
+            speedup = throughput / points[0]["records_per_sec"] * points[0]["workers"] if points else float(count)
+            points.append({
+                "workers": count,
+                "records_per_sec": throughput,
+                "speedup": speedup,
+                "efficiency": speedup / count,
+            })
+    _write_table(results=results)
+    if output is not None:
+        report = {
+            "meta": {
+                "seed": seed,
+                "records": records,
+                "rounds": rounds,
+                "categories": categories,
+                "python": platform.python_version(),
+                "gil_enabled": _gil_enabled(),
+                "cpu_count": os.cpu_count(),
+                "ashwelness_utils": metadata.version("ashwelness-utils"),
+            },
+            "results": results,
+        }
+        output.write_text(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--workers", type=int, nargs="+", default=list(DEFAULT_WORKERS), help="worker counts to run")
+    parser.add_argument("--categories", nargs="+", choices=sorted(CATEGORIES), default=list(CATEGORIES))
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="corpus seed")
+    parser.add_argument("--records", type=int, default=200, help="records per category")
+    parser.add_argument("--rounds", type=int, default=3, help="timed passes over the corpus per worker")
+    parser.add_argument("--output", type=Path, help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+    if min(args.workers) < 1:
+        parser.error("--workers must be at least 1")
+    return run(
+        modes=args.modes,
+        workers=sorted(args.workers),
+        categories=args.categories,
+        seed=args.seed,
+        records=args.records,
+        rounds=args.rounds,
+        output=args.output,
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
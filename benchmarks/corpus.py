@@ -0,0 +1,165 @@
+"""Seeded synthetic PHI/PII log records for the `PhiPiiLogRedactor` benchmarks.
+
+Every category builds records shaped like the ones our services log: a `message` string plus an `extra` mapping.
+The same seed always yields the same corpus, so two benchmark runs (before and after an upgrade) redact identical
+input. All names, emails, phone numbers and tokens are fabricated.
+"""
+
+import random
+import string
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel, Field, ValidationError
+
+from benchmarks.adversarial import CASES as ADVERSARIAL_CASES
+
+Record = dict[str, Any]
+
+FIRST_NAMES = ("jane", "john", "maria", "wei", "amara", "lucas", "priya", "omar")
+LAST_NAMES = ("doe", "smith", "garcia", "chen", "okafor", "silva", "patel", "haddad")
+DOMAINS = ("example.com", "mail.example.org", "clinic.example.net")
+STREETS = ("Main St", "Oak Ave", "Pine Rd", "Maple Dr", "Cedar Ln")
+CITIES = (("Austin", "TX"), ("Denver", "CO"), ("Portland", "OR"), ("Raleigh", "NC"))
+ANALYTES = (
+    ("glucose", "mg/dL", "70-99"),
+    ("hba1c", "%", "4.0-5.6"),
+    ("ldl", "mg/dL", "0-99"),
+    ("tsh", "mIU/L", "0.4-4"),
+)
+ROUTES = ("/v1/kits", "/v1/orders", "/v1/results", "/v1/patients", "/healthz")
+ADVERSARIAL_SIZE = 4_096
+
+
+class _Registration(BaseModel):
+    email: str = Field(pattern=r"^[^@\s]+@[^@\s]+$")
+    phone: str = Field(pattern=r"^\+?[0-9-]{10,15}$")
+    date_of_birth: str = Field(pattern=r"^\d{4}-\d{2}-\d{2}$")
+    kit_id: str = Field(min_length=12)
+
+
+def _email(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)}.{rng.choice(LAST_NAMES)}{rng.randint(1, 999)}@{rng.choice(DOMAINS)}"
+
+
+def _phone(rng: random.Random) -> str:
+    return f"{rng.randint(200, 999)}-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+
+
+def _token(rng: random.Random, length: int = 32) -> str:
+    return "".join(rng.choices(string.ascii_letters + string.digits, k=length))
+
+
+def _kit_id(rng: random.Random) -> str:
+    return f"KIT-{rng.randint(10_000_000, 99_999_999)}"
+
+
+def _address(rng: random.Random) -> dict[str, str]:
+    city, state = rng.choice(CITIES)
+    return {
+        "line1": f"{rng.randint(1, 9_999)} {rng.choice(STREETS)}",
+        "line2": f"Apt {rng.randint(1, 300)}",
+        "city": city,
+        "state": state,
+        "zip_code": f"{rng.randint(10_000, 99_999)}",
+    }
+
+
+def plain_message(rng: random.Random) -> Record:
+    return {
+        "message": f"Handled {rng.choice(('GET', 'POST'))} {rng.choice(ROUTES)} in {rng.randint(1, 900)}ms",
+        "extra": {"request_id": _token(rng, 12), "status_code": rng.choice((200, 201, 204, 404)), "retry": False},
+    }
+
+
+def email_token_heavy(rng: random.Random) -> Record:
+    recipients = ", ".join(_email(rng) for _ in range(rng.randint(2, 6)))
+    return {
+        "message": (
+            f"Sending results to {recipients} with Authorization: Bearer {_token(rng)} "
+            f"api_key={_token(rng, 24)} callback=https://user:{_token(rng, 8)}@hooks.example.com/notify"
+        ),
+        "extra": {
+            "email": _email(rng),
+            "cc": [_email(rng) for _ in range(rng.randint(1, 4))],
+            "headers": {"authorization": f"Bearer {_token(rng)}", "x-request-id": _token(rng, 12)},
+            "note": f"token={_token(rng, 16)} phone={_phone(rng)}",
+        },
+    }
+
+
+def pydantic_error_dump(rng: random.Random) -> Record:
+    try:
+        _Registration.model_validate(
+            {
+                "email": f"{rng.choice(FIRST_NAMES)} at {rng.choice(DOMAINS)}",
+                "phone": f"call {_phone(rng)}",
+                "date_of_birth": f"{rng.randint(1, 12)}/{rng.randint(1, 28)}/{rng.randint(1940, 2010)}",
+                "kit_id": _kit_id(rng)[:6],
+            },
+        )
+    except ValidationError as error:
+        dump = str(error)
+    else:  # pragma: no cover - the payload above never validates
+        dump = ""
+    return {"message": f"Registration rejected: {dump}", "extra": {"kit_id": _kit_id(rng), "errors": dump}}
+
+
+def lab_result_payload(rng: random.Random) -> Record:
+    items = []
+    for _ in range(rng.randint(3, 12)):
+        analyte, units, reference_range = rng.choice(ANALYTES)
+        items.append(
+            {
+                "analyte": analyte,
+                "result_value": f"{rng.uniform(0.5, 250):.1f}",
+                "units": units,
+                "reference_range": reference_range,
+                "flag": rng.choice(("normal", "high", "low")),
+                "loinc": f"{rng.randint(1_000, 99_999)}-{rng.randint(0, 9)}",
+            },
+        )
+    return {
+        "message": f"Received lab results for {_kit_id(rng)}",
+        "extra": {
+            "kit_id": _kit_id(rng),
+            "results": {"panel": "metabolic", "items": items, "reviewed_by": {"email": _email(rng)}},
+        },
+    }
+
+
+def address_container(rng: random.Random) -> Record:
+    return {
+        "message": f"Shipping kit {_kit_id(rng)} to {rng.randint(1, 9_999)} {rng.choice(STREETS)}",
+        "extra": {
+            "order_id": _token(rng, 10),
+            "shipping_address": _address(rng),
+            "billing": {"address": _address(rng), "phone": _phone(rng)},
+            "recipients": [{"name": rng.choice(FIRST_NAMES), "address": _address(rng)} for _ in range(2)],
+        },
+    }
+
+
+def adversarial_input(rng: random.Random) -> Record:
+    name = rng.choice(sorted(ADVERSARIAL_CASES))
+    return {"message": ADVERSARIAL_CASES[name](ADVERSARIAL_SIZE), "extra": {"case": name}}
+
+
+CATEGORIES: dict[str, Callable[[random.Random], Record]] = {
+    "plain": plain_message,
+    "email_token": email_token_heavy,
+    "pydantic_error": pydantic_error_dump,
+    "lab_results": lab_result_payload,
+    "address": address_container,
+    "adversarial": adversarial_input,
+}
+
+
+def generate_corpus(seed: int, records: int, categories: list[str] | None = None) -> dict[str, list[Record]]:
+    """Return `records` records per category, identical for the same `seed`."""
+    corpus: dict[str, list[Record]] = {}
+    for name in categories or list(CATEGORIES):
+        # Each category gets its own stream so adding or skipping one does not shift the others.
+        rng = random.Random(f"{seed}:{name}")  # noqa: S311
+        corpus[name] = [CATEGORIES[name](rng) for _ in range(records)]
+    return corpus
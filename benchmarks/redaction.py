@@ -0,0 +1,172 @@
+"""End-to-end `PhiPiiLogRedactor.redact_record` benchmark over a seeded synthetic corpus.
+
+`run` redacts every record of each corpus category (see `benchmarks.corpus`) for a few rounds and reports
+records/sec, p50/p99 latency and the bytes allocated per record (tracemalloc peak, measured in a separate pass so
+tracing does not skew the timings). `--output` saves the results as JSON; `compare` diffs two saved runs, e.g.
+before and after an upgrade, and can fail when throughput drops by more than a given percentage.
+
+Run from the repository root:
+
+    python -m benchmarks.redaction run --output before.json
+    python -m benchmarks.redaction run --categories plain lab_results --records 200 --output after.json
+    python -m benchmarks.redaction compare before.json after.json --max-regression 10
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from ash_utils.integrations import PhiPiiLogRedactor
+
+from benchmarks.corpus import CATEGORIES, Record, generate_corpus
+
+DEFAULT_SEED = 20_240_601
+METRICS = (
+    ("records_per_sec", "records/s"),
+    ("p50_us", "p50 us"),
+    ("p99_us", "p99 us"),
+    ("alloc_bytes_per_record", "alloc B/rec"),
+)
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def _redact(redactor: PhiPiiLogRedactor, sample: Record) -> None:
+    # `redact_record` replaces `message` and `extra` in place, so each run gets a fresh record around the sample.
+    redactor.redact_record(record={"message": sample["message"], "extra": sample["extra"]})
+
+
+def measure_latencies(redactor: PhiPiiLogRedactor, records: list[Record], rounds: int) -> list[float]:
+    """Return one latency per redacted record, in seconds, after a warm-up round."""
+    for sample in records:
+        _redact(redactor=redactor, sample=sample)
+    latencies = []
+    for _ in range(rounds):
+        for sample in records:
+            started = time.perf_counter()
+            _redact(redactor=redactor, sample=sample)
+            latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def measure_allocations(redactor: PhiPiiLogRedactor, records: list[Record]) -> float:
+    """Return the mean tracemalloc peak, in bytes, while redacting one record."""
+    tracemalloc.start()
+    try:
+        total = 0
+        for sample in records:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            _redact(redactor=redactor, sample=sample)
+            total += tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return total / len(records)
+
+
+def benchmark_category(records: list[Record], rounds: int) -> dict[str, float]:
+    redactor = PhiPiiLogRedactor()
+    latencies = measure_latencies(redactor=redactor, records=records, rounds=rounds)
+    return {
+        "records_per_sec": len(latencies) / sum(latencies),
+        "p50_us": _percentile(latencies, 0.50) * 1e6,
+        "p99_us": _percentile(latencies, 0.99) * 1e6,
+        "alloc_bytes_per_record": measure_allocations(redactor=redactor, records=records),
+    }
+
+
+def _write_table(results: dict[str, dict[str, float]]) -> None:
+    sys.stdout.write(f"{'category':<16}" + "".join(f"{label:>14}" for _, label in METRICS) + "\n")
+    for name, metrics in results.items():
+        row = "".join(f"{metrics[metric]:>14,.1f}" for metric, _ in METRICS)
+        sys.stdout.write(f"{name:<16}{row}\n")
+
+
+def run(categories: list[str], seed: int, records: int, rounds: int, output: Path | None) -> int:
+    corpus = generate_corpus(seed=seed, records=records, categories=categories)
+    results = {name: benchmark_category(records=samples, rounds=rounds) for name, samples in corpus.items()}
+    _write_table(results=results)
+    if output is not None:
+        report = {
+            "meta": {
+                "seed": seed,
+                "records": records,
+                "rounds": rounds,
+                "python": platform.python_version(),
+                "ashwelness_utils": metadata.version("ashwelness-utils"),
+            },
+            "results": results,
+        }
+        output.write_text(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+def compare(baseline: Path, candidate: Path, max_regression: float | None) -> int:
+    """Print per-category changes from `baseline` to `candidate`; non-zero when throughput regressed too far."""
+    before: dict[str, Any] = json.loads(baseline.read_text())
+    after: dict[str, Any] = json.loads(candidate.read_text())
+    if before["meta"]["seed"] != after["meta"]["seed"] or before["meta"]["records"] != after["meta"]["records"]:
+        sys.stderr.write("warning: runs used different corpora (seed or record count differ)\n")
+
+    regressed = []
+    sys.stdout.write(f"{'category':<16}" + "".join(f"{label:>14}" for _, label in METRICS) + "\n")
+    # Positive records/s and negative latency or allocation changes are improvements.
+    for name in [name for name in before["results"] if name in after["results"]]:
+        row = ""
+        for metric, _ in METRICS:
+            old, new = before["results"][name][metric], after["results"][name][metric]
+            change = (new - old) / old * 100 if old else 0.0
+            row += f"{change:>+13.1f}%"
+            if metric == "records_per_sec" and max_regression is not None and change < -max_regression:
+                regressed.append(name)
+        sys.stdout.write(f"{name:<16}{row}\n")
+    if regressed:
+        sys.stderr.write(f"throughput regressed by more than {max_regression}%: {', '.join(sorted(regressed))}\n")
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="benchmark the redactor on a seeded corpus")
+    run_parser.add_argument("--categories", nargs="+", choices=sorted(CATEGORIES), default=list(CATEGORIES))
+    run_parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="corpus seed")
+    run_parser.add_argument("--records", type=int, default=500, help="records per category")
+    run_parser.add_argument("--rounds", type=int, default=3, help="timed passes over each category")
+    run_parser.add_argument("--output", type=Path, help="write the results to this JSON file")
+
+    compare_parser = commands.add_parser("compare", help="diff two saved runs")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("candidate", type=Path)
+    compare_parser.add_argument(
+        "--max-regression",
+        type=float,
+        help="exit non-zero when records/sec drops by more than this percentage in any category",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        return compare(baseline=args.baseline, candidate=args.candidate, max_regression=args.max_regression)
+    return run(
+        categories=args.categories,
+        seed=args.seed,
+        records=args.records,
+        rounds=args.rounds,
+        output=args.output,
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
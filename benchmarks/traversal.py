@@ -0,0 +1,289 @@
+"""Benchmark of the iterative `PhiPiiLogRedactor` walk against the recursive engine it replaced.
+
+`RecursivePhiPiiLogRedactor` keeps the previous recursive traversal (one Python call chain per nesting level)
+as the reference. Both engines redact the same wide and deep fixtures; outputs are compared before timing.
+
+Run from the repository root:
+
+    python -m benchmarks.traversal
+    python -m benchmarks.traversal --fixtures wide_mapping deep_nesting --repeat 20
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable, Mapping
+from itertools import islice
+from typing import Any
+
+from ash_utils.integrations import PhiPiiLogRedactor
+from ash_utils.integrations.loguru import ContextRedactionMemo, KeyClassification, RedactionBudget
+from loguru._logger import context as logger_context
+
+
+class RecursivePhiPiiLogRedactor(PhiPiiLogRedactor):
+    """The recursive traversal used before the explicit-stack walk, kept verbatim for comparison."""
+
+    def _redact_extra(self, extra: object, budget: RedactionBudget | None = None) -> object:
+        context = logger_context.get()
+        if not context or not isinstance(extra, dict):
+            return self._redact_value(value=extra, key="", depth=0, budget=budget)
+        return self._redact_mapping(
+            value=extra,
+            depth=0,
+            parent=self._classify_key(key=""),
+            in_result_payload=False,
+            context_memo=self._get_context_memo(context=context),
+            budget=budget,
+        )
+
+    def _redact_classified_value(
+        self,
+        value: object,
+        *,
+        classification: KeyClassification,
+        depth: int,
+        in_result_payload: bool,
+        budget: RedactionBudget | None = None,
+    ) -> object:
+        if depth > self.REDACTION_DEPTH or (budget is not None and not budget.take_value(value=value)):
+            return self.REDACTED
+
+        should_return_direct_value, direct_value = self._get_direct_redacted_value(
+            classification=classification,
+            value=value,
+        )
+        if should_return_direct_value:
+            return direct_value
+        if classification.redacts_value(in_result_payload=in_result_payload):
+            return self.REDACTED
+
+        if isinstance(value, str):
+            return self._redact_string_value(
+                value=value,
+                classification=classification,
+                in_result_payload=in_result_payload,
+            )
+
+        if isinstance(value, Mapping):
+            return self._redact_mapping(
+                value=value,
+                depth=depth,
+                parent=classification,
+                in_result_payload=in_result_payload,
+                budget=budget,
+            )
+
+        return self._redact_collection_or_object(
+            value=value,
+            classification=classification,
+            depth=depth,
+            in_result_payload=in_result_payload,
+            budget=budget,
+        )
+
+    def _redact_collection_or_object(
+        self,
+        value: object,
+        *,
+        classification: KeyClassification,
+        depth: int,
+        in_result_payload: bool,
+        budget: RedactionBudget | None,
+    ) -> object:
+        if isinstance(value, tuple):
+            redacted_items = self._redact_items(
+                values=value,
+                classification=classification,
+                depth=depth,
+                in_result_payload=in_result_payload,
+                budget=budget,
+            )
+            return self._rebuild_tuple(value=value, redacted_items=redacted_items)
+
+        if isinstance(value, (list, set)):
+            items = value if type(value) is list else list(value)
+            redacted_items = self._redact_items(
+                values=items,
+                classification=classification,
+                depth=depth,
+                in_result_payload=in_result_payload,
+                budget=budget,
+            )
+            return items if redacted_items is None else redacted_items
+
+        return self._redact_object(
+            value=value,
+            plan=None,
+            classification=classification,
+            depth=depth,
+            in_result_payload=in_result_payload,
+            budget=budget,
+        )
+
+    def _redact_items(
+        self,
+        values: list[object] | tuple[object, ...],
+        *,
+        classification: KeyClassification,
+        depth: int,
+        in_result_payload: bool,
+        budget: RedactionBudget | None = None,
+    ) -> list[object] | None:
+        """Redact each item, returning ``None`` when every item came back unchanged."""
+        limit = len(values) if budget is None else budget.item_limit(count=len(values))
+        redacted: list[object] | None = None
+        for index, item in enumerate(islice(values, limit)):
+            redacted_item = self._redact_classified_value(
+                value=item,
+                classification=classification,
+                depth=depth + 1,
+                in_result_payload=in_result_payload,
+                budget=budget,
+            )
+            if redacted is not None:
+                redacted.append(redacted_item)
+            elif redacted_item is not item:
+                redacted = [*values[:index], redacted_item]
+
+        if limit < len(values):
+            redacted = [*(values[:limit] if redacted is None else redacted)]
+            redacted.append(self._summarize_truncated(count=len(values) - limit))
+        return redacted
+
+    def _redact_mapping(
+        self,
+        value: Mapping[object, object],
+        *,
+        depth: int,
+        parent: KeyClassification,
+        in_result_payload: bool,
+        context_memo: ContextRedactionMemo | None = None,
+        budget: RedactionBudget | None = None,
+    ) -> dict[object, object]:
+        limit = len(value) if budget is None else budget.item_limit(count=len(value))
+        items = [
+            (item_key, item_value, self._classify_key(key=item_key))
+            for item_key, item_value in islice(value.items(), limit)
+        ]
+        truncated = len(value) - limit
+        # Keys past the budget are never classified, so a truncated mapping is treated as a result payload.
+        result_payload = (
+            in_result_payload
+            or parent.is_result_container
+            or truncated > 0
+            or self._looks_like_result_payload(classifications=[item[2] for item in items])
+        )
+        address_payload = parent.is_address_container
+
+        redacted: dict[object, object] | None = None
+        for index, (item_key, item_value, classification) in enumerate(items):
+            if address_payload and classification.is_address_child:
+                redacted_value = self.REDACTED
+            elif context_memo is not None and self._is_memoizable_context_value(
+                context=context_memo.context,
+                key=item_key,
+                value=item_value,
+            ):
+                redacted_value = self._redact_context_value(
+                    value=item_value,
+                    memo=context_memo,
+                    memo_key=(str(object=item_key), result_payload),
+                    classification=classification,
+                    depth=depth + 1,
+                    budget=budget,
+                )
+            else:
+                redacted_value = self._redact_classified_value(
+                    value=item_value,
+                    classification=classification,
+                    depth=depth + 1,
+                    in_result_payload=result_payload,
+                    budget=budget,
+                )
+            if redacted is not None:
+                redacted[item_key] = redacted_value
+            elif redacted_value is not item_value:
+                redacted = {previous_key: previous_value for previous_key, previous_value, _ in items[:index]}
+                redacted[item_key] = redacted_value
+
+        if truncated:
+            if redacted is None:
+                redacted = {item_key: item_value for item_key, item_value, _ in items}
+            redacted[self.TRUNCATED] = self._summarize_truncated(count=truncated)
+        if redacted is not None:
+            return redacted
+        if type(value) is dict:
+            return value
+        return {item_key: item_value for item_key, item_value, _ in items}
+
+
+def wide_mapping() -> dict[str, Any]:
+    fields = {f"field_{index}": f"value {index}" if index % 2 else index for index in range(500)}
+    return {"batches": [dict(fields) for _ in range(20)], "email": "jane@example.com"}
+
+
+def wide_list() -> dict[str, Any]:
+    return {"rows": [{"id": index, "status": "ok", "kit_id": f"kit-{index}"} for index in range(2_000)]}
+
+
+def deep_nesting() -> dict[str, Any]:
+    node: dict[str, Any] = {"leaf": "token=abc", "count": 1}
+    for level in range(PhiPiiLogRedactor.REDACTION_DEPTH - 1):
+        node = {"level": level, "child": node, "siblings": [{"a": 1}, {"b": [1, 2, 3]}]}
+    return {"tree": [node for _ in range(200)]}
+
+
+def request_context() -> dict[str, Any]:
+    return {
+        "request_id": "req-1",
+        "path": "/v1/kits",
+        "kit": {"kit_id": "kit-1", "status": "registered", "address": {"line1": "1 Main St", "city": "Austin"}},
+        "results": [{"result_value": "positive", "units": "mg/dL", "loinc": "1234-5"} for _ in range(5)],
+    }
+
+
+FIXTURES: dict[str, Callable[[], dict[str, Any]]] = {
+    "wide_mapping": wide_mapping,
+    "wide_list": wide_list,
+    "deep_nesting": deep_nesting,
+    "request_context": request_context,
+}
+
+
+def measure(redactor: PhiPiiLogRedactor, extra: dict[str, Any], repeat: int) -> float:
+    """Return the best-of-`repeat` time to redact `extra`, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        redactor._redact_extra(extra=extra)  # noqa: SLF001
+        best = min(best, time.perf_counter() - started)
+    return best * 1e6
+
+
+def run(fixtures: list[str], repeat: int) -> int:
+    iterative, recursive = PhiPiiLogRedactor(), RecursivePhiPiiLogRedactor()
+    sys.stdout.write(f"{'fixture':<18}{'recursive':>14}{'iterative':>14}{'speedup':>10}\n")
+    for name in fixtures:
+        extra = FIXTURES[name]()
+        if iterative._redact_extra(extra=extra) != recursive._redact_extra(extra=extra):  # noqa: SLF001
+            sys.stderr.write(f"{name}: iterative and recursive outputs differ\n")
+            return 1
+        recursive_us = measure(redactor=recursive, extra=extra, repeat=repeat)
+        iterative_us = measure(redactor=iterative, extra=extra, repeat=repeat)
+        sys.stdout.write(
+            f"{name:<18}{recursive_us:>12.0f}us{iterative_us:>12.0f}us{recursive_us / iterative_us:>9.2f}x\n",
+        )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", nargs="+", choices=sorted(FIXTURES), default=list(FIXTURES))
+    parser.add_argument("--repeat", type=int, default=10, help="runs per fixture; the fastest is reported")
+    args = parser.parse_args(argv)
+    return run(fixtures=args.fixtures, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import threading
+from io import StringIO
+from unittest import TestCase
+
+from ash_utils.integrations import BackgroundRedactionSink, PhiPiiLogRedactor, RedactingJsonSink
+from loguru import logger
+
+
+class BlockingStream(StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.release.wait(timeout=5)
+        return super().write(text)
+
+
+class FailingSink(RedactingJsonSink):
+    def emit(self, record: object) -> None:  # noqa: ARG002
+        raise RuntimeError("jane@example.com")
+
+
+class BackgroundRedactionSinkTestCase(TestCase):
+    def setUp(self) -> None:
+        logger.remove()
+        # Other test cases leave a redacting patcher installed; the wrapped sink must do the redaction on its own.
+        logger.configure(patcher=lambda _record: None)
+        self.output = StringIO()
+
+    def tearDown(self) -> None:
+        logger.remove()
+
+    def add_sink(self, sink: RedactingJsonSink, max_pending: int = 100) -> BackgroundRedactionSink:
+        background_sink = BackgroundRedactionSink(sink, max_pending=max_pending)
+        logger.add(background_sink, format="{message}")
+        return background_sink
+
+    def lines(self) -> list[dict[str, object]]:
+        return [json.loads(line) for line in self.output.getvalue().splitlines()]
+
+    def test_records_are_redacted_on_worker_thread(self) -> None:
+        background_sink = self.add_sink(RedactingJsonSink(stream=self.output))
+
+        logger.bind(email="jane.doe@example.com").info("Sent token=abc")
+        background_sink.drain()
+
+        (line,) = self.lines()
+        self.assertEqual(line["message"], f"Sent token={PhiPiiLogRedactor.REDACTED}")
+        self.assertEqual(line["email"], "jan...@example.com")
+        self.assertEqual(background_sink.stats.queued, 1)
+
+    def test_full_queue_waits_and_keeps_order(self) -> None:
+        background_sink = self.add_sink(RedactingJsonSink(stream=self.output), max_pending=2)
+
+        for index in range(50):
+            logger.bind(index=index, email="jane@example.com").info("record")
+        background_sink.drain()
+
+        self.assertEqual([line["index"] for line in self.lines()], list(range(50)))
+        self.assertNotIn("jane@example.com", self.output.getvalue())
+        self.assertEqual(background_sink.stats.queued, 50)
+
+    def test_logging_call_does_not_wait_for_the_write(self) -> None:
+        stream = BlockingStream()
+        background_sink = self.add_sink(RedactingJsonSink(stream=stream))
+
+        logger.info("first")
+        logger.info("second")
+        self.assertEqual(stream.getvalue(), "")
+
+        stream.release.set()
+        background_sink.drain()
+        self.assertEqual(len(stream.getvalue().splitlines()), 2)
+
+    def test_complete_and_remove_write_pending_records(self) -> None:
+        self.add_sink(RedactingJsonSink(stream=self.output))
+
+        async def complete() -> None:
+            await logger.complete()
+
+        logger.info("before complete")
+        asyncio.run(complete())
+        self.assertEqual(len(self.lines()), 1)
+
+        logger.info("before remove")
+        logger.remove()
+        self.assertEqual([line["message"] for line in self.lines()], ["before complete", "before remove"])
+
+    def test_records_after_stop_are_written_inline(self) -> None:
+        background_sink = BackgroundRedactionSink(RedactingJsonSink(stream=self.output))
+        background_sink.stop()
+
+        logger.add(background_sink, format="{message}", catch=False)
+        logger.info("late token=abc")
+
+        (line,) = self.lines()
+        self.assertEqual(line["message"], f"late token={PhiPiiLogRedactor.REDACTED}")
+
+    def test_stop_during_concurrent_writes_keeps_every_record(self) -> None:
+        background_sink = self.add_sink(RedactingJsonSink(stream=self.output), max_pending=4)
+
+        def log_records(worker: int) -> None:
+            for index in range(100):
+                logger.bind(worker=worker, index=index).info("record")
+
+        # Daemon threads with timeouts, so a record stuck behind the stop sentinel fails the test instead of hanging.
+        threads = [threading.Thread(target=log_records, args=(worker,), daemon=True) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        background_sink.stop()
+        drainer = threading.Thread(target=background_sink.drain, daemon=True)
+        drainer.start()
+        for thread in [*threads, drainer]:
+            thread.join(timeout=5)
+
+        self.assertFalse(any(thread.is_alive() for thread in [*threads, drainer]))
+        self.assertEqual(len(self.lines()), 400)
+
+    def test_sink_errors_are_counted_without_leaking_the_message(self) -> None:
+        background_sink = self.add_sink(FailingSink(stream=self.output))
+
+        logger.info("first")
+        logger.info("second")
+        background_sink.drain()
+
+        self.assertEqual(background_sink.stats.errors, 2)
+        self.assertEqual(self.output.getvalue(), "")
+
+    def test_max_pending_must_be_positive(self) -> None:
+        with self.assertRaises(ValueError):
+            BackgroundRedactionSink(RedactingJsonSink(stream=self.output), max_pending=0)
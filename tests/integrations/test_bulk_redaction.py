@@ -0,0 +1,119 @@
+import json
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from ash_utils.integrations import PhiPiiLogRedactor, bulk_redaction
+from ash_utils.integrations.bulk_redaction import (
+    ThroughputReport,
+    get_progress_path,
+    main,
+    redact_file,
+    save_progress,
+)
+
+
+class BulkRedactionTestCase(TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.input_path = self.directory / "export.json"
+        entries = [
+            json.dumps({"insertId": str(index), "jsonPayload": {"message": f"token=abc{index}", "kit_id": f"K{index}"}})
+            for index in range(40)
+        ]
+        self.input_path.write_text(
+            "\n".join([*entries[:20], "Authorization: Bearer abc.def", "", *entries[20:]]) + "\n"
+        )
+        self.output_dir = self.directory / "redacted"
+        self.output_path = self.output_dir / "export.json"
+
+    def expected_lines(self) -> list[str]:
+        redactor = PhiPiiLogRedactor()
+        lines = []
+        for line in self.input_path.read_text().splitlines():
+            if not line or not line.startswith("{"):
+                lines.append(redactor.redact_text(value=line))
+                continue
+            redacted = redactor.redact_value(value=json.loads(line))
+            lines.append(json.dumps(redacted, ensure_ascii=False, separators=(",", ":")))
+        return lines
+
+    def run_redact_file(self) -> ThroughputReport:
+        self.output_dir.mkdir(exist_ok=True)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            return redact_file(
+                input_path=self.input_path,
+                output_path=self.output_path,
+                executor=executor,
+                workers=2,
+                chunk_bytes=256,
+                redactor_path=None,
+            )
+
+    def test_chunks_are_redacted_and_written_in_order(self) -> None:
+        exit_code = main([str(self.input_path), "--output-dir", str(self.output_dir), "--workers", "2"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(self.output_path.read_text().splitlines(), self.expected_lines())
+        self.assertIn('"message":"token=[REDACTED]"', self.output_path.read_text())
+        self.assertIn("Authorization: Bearer [REDACTED]", self.output_path.read_text())
+        self.assertFalse(get_progress_path(output_path=self.output_path).exists())
+
+    def test_interrupted_run_resumes_from_saved_progress(self) -> None:
+        saves = 0
+
+        def interrupt_after_three_chunks(**kwargs: object) -> None:
+            nonlocal saves
+            saves += 1
+            if saves > 3:  # noqa: PLR2004
+                raise KeyboardInterrupt
+            save_progress(**kwargs)  # type: ignore[arg-type]
+
+        with (
+            patch.object(bulk_redaction, "save_progress", side_effect=interrupt_after_three_chunks),
+            self.assertRaises(KeyboardInterrupt),
+        ):
+            self.run_redact_file()
+        progress = json.loads(get_progress_path(output_path=self.output_path).read_text())
+        self.assertGreater(progress["input_offset"], 0)
+
+        report = self.run_redact_file()
+
+        self.assertEqual(report.resumed_bytes, progress["input_offset"])
+        self.assertEqual(self.output_path.read_text().splitlines(), self.expected_lines())
+        self.assertFalse(get_progress_path(output_path=self.output_path).exists())
+
+    def test_report_counts_each_input_line_once(self) -> None:
+        report = self.run_redact_file()
+
+        self.assertEqual(report.lines, len(self.input_path.read_text().splitlines()))
+
+    def test_progress_for_a_changed_input_is_ignored(self) -> None:
+        self.output_dir.mkdir()
+        self.output_path.write_text("stale")
+        get_progress_path(output_path=self.output_path).write_text(
+            json.dumps({"input_size": 1, "input_mtime_ns": 1, "input_offset": 1, "output_offset": 5})
+        )
+
+        self.run_redact_file()
+
+        self.assertEqual(self.output_path.read_text().splitlines(), self.expected_lines())
+
+    def test_output_dir_must_not_hold_the_inputs(self) -> None:
+        with self.assertRaises(SystemExit):
+            main([str(self.input_path), "--output-dir", str(self.directory)])
+
+    def test_inputs_with_the_same_name_are_rejected(self) -> None:
+        other_input = self.directory / "other" / self.input_path.name
+        other_input.parent.mkdir()
+        other_input.write_text(self.input_path.read_text())
+
+        with self.assertRaises(SystemExit) as raised:
+            main([str(self.input_path), str(other_input), "--output-dir", str(self.output_dir)])
+
+        self.assertNotEqual(raised.exception.code, 0)
+        self.assertFalse(self.output_path.exists())
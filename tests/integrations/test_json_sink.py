@@ -0,0 +1,115 @@
+import json
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from ash_utils.integrations import PhiPiiLogRedactor, PhiPiiLogRedactorConfig, RedactingJsonSink
+from ash_utils.integrations.loguru import REDACTION_MARKER_KEY
+from loguru import logger
+
+
+class RedactingJsonSinkTestCase(TestCase):
+    def setUp(self) -> None:
+        logger.remove()
+        # Other test cases leave a redacting patcher installed; this sink must do the redaction on its own.
+        logger.configure(patcher=lambda _record: None)
+        self.output = StringIO()
+        logger.add(RedactingJsonSink(stream=self.output, gcp_project_id="ash-project"), format="{message}")
+
+    def tearDown(self) -> None:
+        logger.remove()
+
+    def lines(self) -> list[dict[str, object]]:
+        return [json.loads(line) for line in self.output.getvalue().splitlines()]
+
+    def test_writes_one_redacted_structured_line_per_record(self) -> None:
+        logger.bind(patient_email="jane.doe@example.com", kit_id="KIT-1").info("Sent token=abc")
+        logger.warning("second")
+
+        first, second = self.lines()
+        self.assertEqual(first["severity"], "INFO")
+        self.assertEqual(first["message"], f"Sent token={PhiPiiLogRedactor.REDACTED}")
+        self.assertEqual(first["patient_email"], "jan...@example.com")
+        self.assertEqual(first["kit_id"], "KIT-1")
+        self.assertEqual(first["logging.googleapis.com/sourceLocation"]["function"], self._testMethodName)
+        self.assertIn("time", first)
+        self.assertEqual(second["severity"], "WARNING")
+
+    def test_record_seen_by_other_sinks_is_left_unchanged(self) -> None:
+        records: list[dict[str, object]] = []
+        logger.add(lambda message: records.append(message.record), format="{message}")
+
+        logger.bind(email="jane@example.com").info("token=abc")
+
+        self.assertEqual(records[0]["message"], "token=abc")
+        self.assertEqual(records[0]["extra"], {"email": "jane@example.com"})
+
+    def test_exception_chain_is_redacted_into_stack_trace(self) -> None:
+        try:
+            try:
+                raise ValueError("lookup failed for jane@example.com")  # noqa: TRY301
+            except ValueError as error:
+                raise RuntimeError("wrapped") from error
+        except RuntimeError:
+            logger.exception("boom")
+
+        (line,) = self.lines()
+        self.assertEqual(line["severity"], "ERROR")
+        self.assertIn("ValueError: lookup failed for jan...@example.com", line["stack_trace"])
+        self.assertIn("RuntimeError: wrapped", line["stack_trace"])
+        self.assertNotIn("jane@example.com", self.output.getvalue())
+
+    def test_trace_fields_and_severity_mapping(self) -> None:
+        logger.level("AUDIT", no=35)
+        logger.bind(trace_id="abc123", span_id="7").log("SUCCESS", "ok")
+        logger.log("AUDIT", "audited")
+
+        success, audit = self.lines()
+        self.assertEqual(success["severity"], "NOTICE")
+        self.assertEqual(success["logging.googleapis.com/trace"], "projects/ash-project/traces/abc123")
+        self.assertEqual(success["logging.googleapis.com/spanId"], "7")
+        self.assertEqual(audit["severity"], "WARNING")
+
+    def test_extra_does_not_override_structured_fields(self) -> None:
+        logger.bind(severity="DEBUG", message="spoofed").error("real")
+
+        (line,) = self.lines()
+        self.assertEqual((line["severity"], line["message"]), ("ERROR", "real"))
+
+    def test_unencodable_extra_is_replaced(self) -> None:
+        logger.bind(payload={("a", "b"): 1}).info("odd keys")
+
+        (line,) = self.lines()
+        self.assertEqual(line["message"], "odd keys")
+        self.assertEqual(line["extra"], "[UNSERIALIZABLE]")
+
+    def test_marked_record_is_written_without_redacting_again_or_the_marker(self) -> None:
+        redactor = PhiPiiLogRedactor(config=PhiPiiLogRedactorConfig(provenance_marker=True))
+        logger.remove()
+        sink = RedactingJsonSink(stream=self.output, redactor=redactor)
+        logger.configure(patcher=redactor)
+        logger.add(sink, format="{message}")
+
+        with patch.object(sink.redactor, "_redact_extra", wraps=sink.redactor._redact_extra) as redact_extra:
+            logger.bind(email="jane@example.com").info("token=abc")
+
+        # Once, by the patcher; the sink sees its own redactor's marker and writes the record as it is.
+        redact_extra.assert_called_once()
+        (line,) = self.lines()
+        self.assertEqual(
+            (line["message"], line["email"]), (f"token={PhiPiiLogRedactor.REDACTED}", "jan...@example.com")
+        )
+        self.assertNotIn(REDACTION_MARKER_KEY, line)
+
+    def test_record_marked_by_another_redactor_is_redacted_again(self) -> None:
+        logger.remove()
+        sink = RedactingJsonSink(stream=self.output)
+        logger.configure(patcher=PhiPiiLogRedactor(config=PhiPiiLogRedactorConfig(provenance_marker=True)))
+        logger.add(sink, format="{message}")
+
+        with patch.object(sink.redactor, "_redact_extra", wraps=sink.redactor._redact_extra) as redact_extra:
+            logger.bind(email="jane@example.com").info("token=abc")
+
+        redact_extra.assert_called_once()
+        (line,) = self.lines()
+        self.assertNotIn(REDACTION_MARKER_KEY, line)
@@ -0,0 +1,165 @@
+import threading
+from unittest import TestCase
+
+from ash_utils.integrations.redaction_cache import BoundedClockCache, BoundedLRUCache, ShardedCache
+
+
+class BoundedLRUCacheTestCase(TestCase):
+    def test_get_counts_hits_and_misses(self) -> None:
+        cache: BoundedLRUCache[str, int] = BoundedLRUCache(maxsize=2)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+
+        stats = cache.stats()
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(stats.size, 1)
+        self.assertEqual(stats.hit_ratio, 0.5)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache: BoundedLRUCache[str, int] = BoundedLRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_zero_maxsize_disables_storage(self) -> None:
+        cache: BoundedLRUCache[str, int] = BoundedLRUCache(maxsize=0)
+        cache.put("a", 1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_negative_maxsize_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            BoundedLRUCache(maxsize=-1)
+
+    def test_concurrent_access_keeps_size_bounded(self) -> None:
+        cache: BoundedLRUCache[int, int] = BoundedLRUCache(maxsize=16)
+
+        def worker(offset: int) -> None:
+            for index in range(500):
+                cache.put(offset + index, index)
+                cache.get(offset + index // 2)
+
+        threads = [threading.Thread(target=worker, args=(offset * 1000,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        self.assertLessEqual(stats.size, 16)
+        self.assertEqual(stats.hits + stats.misses, 2000)
+
+
+class BoundedClockCacheTestCase(TestCase):
+    def test_get_counts_hits_and_misses(self) -> None:
+        cache: BoundedClockCache[str, int] = BoundedClockCache(maxsize=2)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        cache.put("a", 2)
+        self.assertEqual(cache.get("a"), 2)
+
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 1, 1))
+
+    def test_referenced_entries_get_a_second_chance(self) -> None:
+        cache: BoundedClockCache[str, int] = BoundedClockCache(maxsize=3)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        cache.get("a")
+        cache.put("d", 4)
+        cache.put("e", 5)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNone(cache.get("c"))
+        self.assertEqual((cache.get("d"), cache.get("e")), (4, 5))
+        self.assertEqual(cache.stats().evictions, 2)
+
+    def test_zero_maxsize_disables_storage(self) -> None:
+        cache: BoundedClockCache[str, int] = BoundedClockCache(maxsize=0)
+        cache.put("a", 1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_negative_maxsize_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            BoundedClockCache(maxsize=-1)
+
+    def test_clear_empties_the_cache(self) -> None:
+        cache: BoundedClockCache[int, int] = BoundedClockCache(maxsize=2)
+        for key in range(5):
+            cache.put(key, key)
+        cache.clear()
+        cache.put(10, 10)
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get(10), 10)
+
+    def test_concurrent_access_keeps_size_bounded(self) -> None:
+        cache: BoundedClockCache[int, int] = BoundedClockCache(maxsize=16)
+
+        def worker(offset: int) -> None:
+            for index in range(500):
+                cache.put(offset + index, index)
+                cache.get(offset + index // 2)
+
+        threads = [threading.Thread(target=worker, args=(offset * 1000,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        self.assertLessEqual(stats.size, 16)
+        self.assertEqual(stats.hits + stats.misses, 2000)
+
+
+class ShardedCacheTestCase(TestCase):
+    def test_capacity_is_split_between_shards(self) -> None:
+        cache: ShardedCache[int, int] = ShardedCache(maxsize=1000, shards=8)
+        for key in range(5000):
+            cache.put(key, key)
+            cache.get(key)
+
+        stats = cache.stats()
+        self.assertEqual(cache.shard_count, 8)
+        self.assertEqual(stats.size, 1000)
+        self.assertEqual((stats.hits, stats.misses, stats.evictions, stats.maxsize), (5000, 0, 4000, 1000))
+        self.assertEqual(cache.get(4999), 4999)
+
+    def test_small_cache_keeps_one_shard_and_exact_eviction_order(self) -> None:
+        cache: ShardedCache[str, int] = ShardedCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertEqual(cache.shard_count, 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+
+    def test_clock_shards_and_disabled_cache(self) -> None:
+        cache: ShardedCache[str, int] = ShardedCache(maxsize=256, cache_factory=BoundedClockCache)
+        cache.put("a", 1)
+        cache.clear()
+        disabled: ShardedCache[str, int] = ShardedCache(maxsize=0)
+        disabled.put("a", 1)
+
+        self.assertEqual(cache.shard_count, 4)
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(disabled.get("a"))
+
+    def test_invalid_sizes_raise(self) -> None:
+        with self.assertRaises(ValueError):
+            ShardedCache(maxsize=-1)
+        with self.assertRaises(ValueError):
+            ShardedCache(maxsize=16, shards=0)
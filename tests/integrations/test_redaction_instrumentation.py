@@ -0,0 +1,63 @@
+import threading
+from collections.abc import Callable
+from unittest import TestCase
+
+from ash_utils.integrations.redaction_instrumentation import PerThreadCells, RedactionInstrumentation
+
+
+def run_threads(target: Callable[[], None], count: int) -> None:
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class PerThreadCellsTestCase(TestCase):
+    def test_each_thread_counts_in_its_own_cell(self) -> None:
+        cells = PerThreadCells(factory=lambda: [0])
+        barrier = threading.Barrier(4)
+
+        def count() -> None:
+            cell = cells.get()
+            # Every thread holds its cell before any exits, so none is handed over.
+            barrier.wait(timeout=5)
+            for _ in range(1000):
+                cells.get()[0] += 1
+            self.assertIs(cells.get(), cell)
+
+        run_threads(target=count, count=4)
+
+        self.assertEqual(sorted(cell[0] for cell in cells.cells()), [1000] * 4)
+
+    def test_exited_threads_hand_their_cells_to_new_threads(self) -> None:
+        cells = PerThreadCells(factory=lambda: [0])
+
+        def count() -> None:
+            cells.get()[0] += 1
+
+        for _ in range(5):
+            run_threads(target=count, count=1)
+
+        self.assertEqual(cells.cells(), [[5]])
+
+
+class RedactionInstrumentationTestCase(TestCase):
+    def test_snapshot_merges_counts_from_every_thread(self) -> None:
+        instrumentation = RedactionInstrumentation()
+
+        def record() -> None:
+            for _ in range(100):
+                instrumentation.record_rule("email", changed=True, seconds=0.5, chars_scanned=2)
+                instrumentation.record_key_rule("email")
+            instrumentation.record_redaction_error()
+
+        run_threads(target=record, count=3)
+
+        stats = instrumentation.snapshot()
+        email = stats.string_rules["email"]
+        self.assertEqual((email.runs, email.hits, email.seconds, email.chars_scanned), (300, 300, 150.0, 600))
+        self.assertEqual((stats.key_rules, stats.redaction_errors), ({"email": 300}, 3))
+
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot().string_rules, {})
@@ -3,6 +3,7 @@ from unittest import IsolatedAsyncioTestCase, mock
 from unittest.mock import MagicMock, patch
 
 from ash_utils.integrations.constants import KEYS_TO_FILTER, REDACTION_STRING, LoguruConfigs
+from ash_utils.integrations.loguru import REDACTION_MARKER_KEY, PhiPiiLogRedactor, PhiPiiLogRedactorConfig
 from ash_utils.integrations.sentry import (
     _redact_exception,
     _redact_logentry,
@@ -261,6 +262,25 @@ class SentryUtilitiesTestcase(IsolatedAsyncioTestCase):
         )
         self.assertEqual(redacted_event["extra"]["extra"]["kit_id"], "test-kit-id")
 
+    def test_before_send__marked_record__message_still_scanned(self):
+        """
+        Test that messages of records PhiPiiLogRedactor marked still get the key scan, which covers keys its rules do not.
+        """
+        redactor = PhiPiiLogRedactor(config=PhiPiiLogRedactorConfig(provenance_marker=True))
+        record = {
+            "message": "Patient first_name=John last_name=Doe dob=1990-01-01 city=Boston zip=02110",
+            "extra": {"kit_id": "test-kit-id"},
+        }
+        redactor.redact_record(record=record)
+        self.assertIn(REDACTION_MARKER_KEY, record)
+        event = {"logentry": {"message": record["message"]}, "extra": {"extra": record["extra"]}}
+
+        redacted_message = before_send(event, None)["logentry"]["message"]
+
+        self.assertTrue(redacted_message.startswith("REDACTED SENSITIVE ERROR | key: "))
+        for value in ("John", "Doe", "Boston", "02110"):
+            self.assertNotIn(value, redacted_message)
+
     def test_initialize_sentry_default_params(self):
         """
         Test the initialize_sentry function with default parameters.
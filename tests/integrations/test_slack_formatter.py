@@ -1,10 +1,18 @@
 # ruff: noqa: PT009
 
 import logging
+from typing import Any
 from unittest import TestCase
+from unittest.mock import patch
 
-from ash_utils.integrations import SlackAttachmentFormatter, SlackAttachmentFormatterConfig
-from ash_utils.integrations.slack_formatter import build_gcp_logs_explorer_url, build_sentry_issue_url
+from ash_utils.integrations import (
+    PhiPiiLogRedactor,
+    PhiPiiLogRedactorConfig,
+    SlackAttachmentFormatter,
+    SlackAttachmentFormatterConfig,
+)
+from ash_utils.integrations.loguru import REDACTION_MARKER_KEY
+from ash_utils.integrations.slack_formatter import build_gcp_logs_explorer_url, build_sentry_issue_url, sanitize_extra
 
 
 class SlackAttachmentFormatterTestCase(TestCase):
@@ -415,6 +423,22 @@ class SlackAttachmentFormatterTestCase(TestCase):
         self.assertIn("production", rendered)
         self.assertNotIn("staging", rendered)
 
+    def test_format_sanitizes_extra_of_marked_loguru_records_without_showing_the_marker(self) -> None:
+        formatter = SlackAttachmentFormatter(config=SlackAttachmentFormatterConfig(service_name="orders-api"))
+        redactor = PhiPiiLogRedactor(config=PhiPiiLogRedactorConfig(provenance_marker=True))
+        loguru_record: dict[str, Any] = {"message": "Sent", "extra": {"kit_id": "KIT123"}}
+        redactor.redact_record(record=loguru_record)
+        self.assertIn(REDACTION_MARKER_KEY, loguru_record)
+        # Loguru's logging bridge forwards only `extra`, as `StandardSink` does.
+        marked = _build_record(message="Sent", level=logging.ERROR, extras={"extra": loguru_record["extra"]})
+
+        with patch("ash_utils.integrations.slack_formatter.sanitize_extra", wraps=sanitize_extra) as sanitize:
+            marked_payload = formatter.format(record=marked)
+
+        sanitize.assert_called_once()
+        self.assertIn("KIT123", marked_payload["text"])
+        self.assertNotIn(redactor.redaction_marker, str(marked_payload))
+
 
 def _build_record(message: str, level: int, extras: dict[str, object]) -> logging.LogRecord:
     record = logging.LogRecord(